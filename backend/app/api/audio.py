@@ -482,6 +482,7 @@ async def analyze_audio(
             audio_id=audio.id,
             func=BEAT_ANALYSIS_TASK,
             job_id=job_id,
+            force=True,
         )
     except Exception as e:
         raise HTTPException(
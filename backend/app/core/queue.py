@@ -124,6 +124,7 @@ def enqueue_beat_analysis(
     audio_id: str,
     func: Callable,
     job_id: Optional[str] = None,
+    force: bool = False,
 ) -> Job:
     """
     Enqueue a beat analysis job.
@@ -133,6 +134,7 @@ def enqueue_beat_analysis(
         audio_id: Audio track UUID
         func: Beat analysis function to execute
         job_id: Optional custom job ID
+        force: Re-run detection even if a cached beat grid exists
 
     Returns:
         Job: The enqueued RQ job
@@ -142,6 +144,7 @@ def enqueue_beat_analysis(
         func,
         project_id=project_id,
         audio_id=audio_id,
+        force=force,
         job_timeout=JOB_TIMEOUTS["beat_analysis"],
         job_id=job_id,
     )
@@ -261,12 +261,16 @@ def get_file_category(filename: str) -> str | None:
     return None
 
 
-def ensure_project_directories(project_id: str) -> dict[str, Path]:
+def ensure_project_directories(
+    project_id: str, storage_root: Path | None = None
+) -> dict[str, Path]:
     """
     Create all necessary directories for a project.
 
     Args:
         project_id: Valid UUID string for the project
+        storage_root: Storage root to create directories under
+                      (defaults to the configured storage root)
 
     Returns:
         dict[str, Path]: Dictionary mapping category names to their paths
@@ -283,7 +287,8 @@ def ensure_project_directories(project_id: str) -> dict[str, Path]:
     if not validate_project_id(project_id):
         raise ValueError("Invalid project ID: must be a valid UUID")
 
-    storage_root = get_storage_root()
+    if storage_root is None:
+        storage_root = get_storage_root()
     base_path = storage_root / "uploads" / project_id
 
     directories = {}
@@ -12,7 +12,6 @@ import os
 import stat
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -102,8 +101,7 @@ class TestEnsureProjectDirectories:
         """Test that all project directories are created."""
         project_id = "550e8400-e29b-41d4-a716-446655440000"
 
-        with patch("app.core.storage.get_storage_root", return_value=tmp_path):
-            directories = ensure_project_directories(project_id)
+        directories = ensure_project_directories(project_id, storage_root=tmp_path)
 
         # Check all expected directories exist
         assert "media" in directories
@@ -126,15 +124,16 @@ class TestEnsureProjectDirectories:
         """
         project_id = "550e8400-e29b-41d4-a716-446655440000"
 
-        with patch("app.core.storage.get_storage_root", return_value=tmp_path):
-            directories = ensure_project_directories(project_id)
+        directories = ensure_project_directories(project_id, storage_root=tmp_path)
 
         # Check permissions on key directories that worker needs to write to
         critical_dirs = ["derived", "outputs"]
 
         for dir_name in critical_dirs:
-            dir_path = directories[dir_name]
-            mode = dir_path.stat().st_mode
+            # One listing of {storage_root}/{dir_name} yields the project dir mode.
+            with os.scandir(directories[dir_name].parent) as entries:
+                modes = {e.name: e.stat(follow_symlinks=False).st_mode for e in entries}
+            mode = modes[project_id]
 
             # Must have world-writable permissions
             assert mode & stat.S_IWOTH, (
@@ -154,8 +153,7 @@ class TestEnsureProjectDirectories:
         """
         project_id = "550e8400-e29b-41d4-a716-446655440000"
 
-        with patch("app.core.storage.get_storage_root", return_value=tmp_path):
-            directories = ensure_project_directories(project_id)
+        directories = ensure_project_directories(project_id, storage_root=tmp_path)
 
         derived_dir = directories["derived"]
 
@@ -175,12 +173,11 @@ class TestEnsureProjectDirectories:
 
     def test_invalid_project_id_raises_error(self, tmp_path: Path):
         """Test that invalid project ID raises ValueError."""
-        with patch("app.core.storage.get_storage_root", return_value=tmp_path):
-            with pytest.raises(ValueError, match="Invalid project ID"):
-                ensure_project_directories("not-a-valid-uuid")
+        with pytest.raises(ValueError, match="Invalid project ID"):
+            ensure_project_directories("not-a-valid-uuid", storage_root=tmp_path)
 
-            with pytest.raises(ValueError, match="Invalid project ID"):
-                ensure_project_directories("../../../etc/passwd")
+        with pytest.raises(ValueError, match="Invalid project ID"):
+            ensure_project_directories("../../../etc/passwd", storage_root=tmp_path)
 
 
 class TestSanitizeFilename:
@@ -147,7 +147,27 @@ class TestStorageModuleFunctions:
             "Directory should be world-writable (others have rwx)"
         )
 
-    def test_ensure_project_directories_permissions(self, tmp_path: Path, monkeypatch):
+    def test_mkdir_world_writable_leaves_parents_to_umask(self, tmp_path: Path):
+        """Only the leaf is world-writable; missing parents follow the umask."""
+        try:
+            from app.core.storage import _mkdir_world_writable
+        except (ImportError, Exception) as e:
+            pytest.skip(f"Cannot import storage module: {e}")
+
+        previous_umask = os.umask(0o022)
+        try:
+            leaf = tmp_path / "a" / "b" / "leaf"
+            _mkdir_world_writable(leaf)
+        finally:
+            os.umask(previous_umask)
+
+        assert stat.S_IMODE(leaf.stat().st_mode) == 0o777
+        for parent in (tmp_path / "a", tmp_path / "a" / "b"):
+            assert stat.S_IMODE(parent.stat().st_mode) == 0o755, (
+                f"{parent} should not be world-writable"
+            )
+
+    def test_ensure_project_directories_permissions(self, tmp_path: Path):
         """
         Test that ensure_project_directories creates world-writable dirs.
 
@@ -158,17 +178,8 @@ class TestStorageModuleFunctions:
         except (ImportError, Exception) as e:
             pytest.skip(f"Cannot import storage module: {e}")
 
-        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
-
-        # Clear any cached settings
-        try:
-            from app.core.config import get_settings
-            get_settings.cache_clear()
-        except (ImportError, AttributeError):
-            pass
-
         project_id = "550e8400-e29b-41d4-a716-446655440000"
-        directories = ensure_project_directories(project_id)
+        directories = ensure_project_directories(project_id, storage_root=tmp_path)
 
         # Check that derived directory is world-writable
         derived_dir = directories["derived"]
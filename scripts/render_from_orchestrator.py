@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
 from pathlib import Path
 
@@ -44,6 +45,15 @@ _DEFAULT_SHOT_MS = 3_000
 # Files at or below this threshold are treated as placeholder stubs.
 _MIN_REAL_ASSET_BYTES = 100
 
+# Orchestrator VO item_id layout: "vo-<scene_id>-<speaker_id>-<NNN>"
+# (e.g. "vo-scene-001-commander-000" → scene_id "scene-001").  Both ids may
+# contain hyphens, so the scene_id is recovered by stripping the item's own
+# "-<speaker_id>" from the captured "<scene_id>-<speaker_id>" part.
+_VO_ID_RE = re.compile(r"^vo-(.+)-\d+$")
+
+# Orchestrator resolution string: "<width>x<height>" (e.g. "1280x720").
+_RESOLUTION_RE = re.compile(r"^(\d+)x(\d+)$")
+
 
 # ---------------------------------------------------------------------------
 # Contract validation
@@ -77,6 +87,17 @@ def _validate_contract(data: dict, label: str) -> None:
 # Schema adapters
 # ---------------------------------------------------------------------------
 
+def _vo_scene_id(item_id: str, speaker_id: str) -> str | None:
+    """Return the scene_id encoded in a VO *item_id*, or None if it does not parse."""
+    m = _VO_ID_RE.match(item_id)
+    if m is None:
+        return None
+    head, suffix = m.group(1), f"-{speaker_id}"
+    if len(head) <= len(suffix) or not head.endswith(suffix):
+        return None
+    return head[: -len(suffix)]
+
+
 def _adapt_manifest(raw: dict, timing_lock_hash: str) -> AssetManifest:
     """
     Translate orchestrator AssetManifest JSON → renderer AssetManifest model.
@@ -93,6 +114,36 @@ def _adapt_manifest(raw: dict, timing_lock_hash: str) -> AssetManifest:
     shots[]              one Shot per scene, each containing visual_assets and vo_lines
     timing_lock_hash     taken from the companion RenderPlan (absent in orchestrator manifest)
     """
+    # Bucket VO lines by scene_id in a single pass over vo_items.  An item_id
+    # that does not follow the layout (or names an unknown scene) falls back
+    # to matching every scene_id it contains, as substring lookup always did.
+    scene_ids = [bg["scene_id"] for bg in raw.get("backgrounds", [])]
+    known_scenes = set(scene_ids)
+    vo_lines_by_scene: dict[str, list[VOLine]] = {}
+    for vo in raw.get("vo_items", []):
+        line = VOLine(
+            line_id=vo["item_id"],
+            speaker_id=vo["speaker_id"],
+            text=vo["text"],
+        )
+        scene_id = _vo_scene_id(vo["item_id"], vo["speaker_id"])
+        if scene_id in known_scenes:
+            vo_lines_by_scene.setdefault(scene_id, []).append(line)
+            continue
+        for scene_id in scene_ids:
+            if scene_id in vo["item_id"]:
+                vo_lines_by_scene.setdefault(scene_id, []).append(line)
+
+    # Character packs are not scene-bound: build them once, share across shots.
+    char_assets: list[VisualAsset] = [
+        VisualAsset(
+            asset_id=cp["pack_id"],
+            role="character",
+            placeholder=cp.get("is_placeholder", False),
+        )
+        for cp in raw.get("character_packs", [])
+    ]
+
     shots: list[Shot] = []
 
     for bg in raw.get("backgrounds", []):
@@ -104,26 +155,8 @@ def _adapt_manifest(raw: dict, timing_lock_hash: str) -> AssetManifest:
                 asset_id=bg["bg_id"],
                 role="background",
                 placeholder=bg.get("is_placeholder", False),
-            )
-        ]
-        for cp in raw.get("character_packs", []):
-            visual_assets.append(
-                VisualAsset(
-                    asset_id=cp["pack_id"],
-                    role="character",
-                    placeholder=cp.get("is_placeholder", False),
-                )
-            )
-
-        # VO lines: match items whose item_id contains this scene_id.
-        vo_lines: list[VOLine] = [
-            VOLine(
-                line_id=vo["item_id"],
-                speaker_id=vo["speaker_id"],
-                text=vo["text"],
-            )
-            for vo in raw.get("vo_items", [])
-            if scene_id in vo["item_id"]
+            ),
+            *char_assets,
         ]
 
         shots.append(
@@ -131,7 +164,7 @@ def _adapt_manifest(raw: dict, timing_lock_hash: str) -> AssetManifest:
                 shot_id=scene_id,
                 duration_ms=_DEFAULT_SHOT_MS,
                 visual_assets=visual_assets,
-                vo_lines=vo_lines,
+                vo_lines=vo_lines_by_scene.get(scene_id, []),
             )
         )
 
@@ -149,6 +182,8 @@ def _adapt_plan(raw: dict, render_plan_path: Path) -> RenderPlan:
     """
     Translate orchestrator RenderPlan JSON → renderer RenderPlan model.
 
+    *render_plan_path* must already be absolute (main() resolves it once).
+
     Key adaptations
     ---------------
     resolution  "WxH" string  →  Resolution(width, height, aspect)
@@ -159,10 +194,14 @@ def _adapt_plan(raw: dict, render_plan_path: Path) -> RenderPlan:
                                renderer falls back to generated placeholders.
     audio_resolutions          empty — no TTS audio in Phase 0 demo run.
     """
-    width_str, height_str = raw["resolution"].split("x", 1)
+    m = _RESOLUTION_RE.match(raw["resolution"])
+    if m is None:
+        raise ValueError(
+            f"invalid resolution {raw['resolution']!r}; expected 'WIDTHxHEIGHT'"
+        )
     resolution = Resolution(
-        width=int(width_str),
-        height=int(height_str),
+        width=int(m.group(1)),
+        height=int(m.group(2)),
         aspect=raw["aspect_ratio"],
     )
 
@@ -176,7 +215,7 @@ def _adapt_plan(raw: dict, render_plan_path: Path) -> RenderPlan:
         # Setting asset_manifest_ref to the render-plan file URI causes
         # PreviewRenderer to write this value into RenderOutput.render_plan_ref
         # (see preview_local.py line 151: render_plan_ref=self.plan.asset_manifest_ref).
-        asset_manifest_ref=f"file://{render_plan_path.resolve()}",
+        asset_manifest_ref=f"file://{render_plan_path}",
         timing_lock_hash=raw["timing_lock_hash"],
         asset_resolutions={},
         audio_resolutions={},
@@ -211,6 +250,16 @@ def _adapt_manifest_final(raw: dict, timing_lock_hash: str) -> AssetManifest:
     characters  = [i for i in items if i["asset_type"] == "character"]
     vo_items    = [i for i in items if i["asset_type"] == "vo"]
 
+    char_assets: list[VisualAsset] = [
+        VisualAsset(
+            asset_id=cp["asset_id"],
+            role="character",
+            asset_uri=cp.get("uri"),
+            placeholder=cp.get("is_placeholder", False),
+        )
+        for cp in characters
+    ]
+
     shots: list[Shot] = []
     for bg in backgrounds:
         bg_id    = bg["asset_id"]
@@ -222,17 +271,9 @@ def _adapt_manifest_final(raw: dict, timing_lock_hash: str) -> AssetManifest:
                 role="background",
                 asset_uri=bg.get("uri"),
                 placeholder=bg.get("is_placeholder", False),
-            )
+            ),
+            *char_assets,
         ]
-        for cp in characters:
-            visual_assets.append(
-                VisualAsset(
-                    asset_id=cp["asset_id"],
-                    role="character",
-                    asset_uri=cp.get("uri"),
-                    placeholder=cp.get("is_placeholder", False),
-                )
-            )
 
         vo_lines: list[VOLine] = []
         for vo in vo_items:
@@ -357,8 +398,12 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        raw_manifest = json.loads(args.asset_manifest.read_text(encoding="utf-8"))
-        raw_plan = json.loads(args.render_plan.read_text(encoding="utf-8"))
+        # Resolve both inputs once; the absolute paths feed the file:// refs below.
+        asset_manifest_path = args.asset_manifest.resolve(strict=True)
+        render_plan_path = args.render_plan.resolve(strict=True)
+
+        raw_manifest = json.loads(asset_manifest_path.read_text(encoding="utf-8"))
+        raw_plan = json.loads(render_plan_path.read_text(encoding="utf-8"))
 
         # Validate inputs against canonical contracts before doing any work.
         _validate_contract(raw_manifest, f"asset manifest ({args.asset_manifest.name})")
@@ -374,10 +419,10 @@ def main() -> None:
             plan = RenderPlan.model_validate(raw_plan)
         elif "items" in raw_manifest:
             manifest = _adapt_manifest_final(raw_manifest, raw_plan["timing_lock_hash"])
-            plan = _adapt_plan(raw_plan, args.render_plan)
+            plan = _adapt_plan(raw_plan, render_plan_path)
         else:
             manifest = _adapt_manifest(raw_manifest, raw_plan["timing_lock_hash"])
-            plan = _adapt_plan(raw_plan, args.render_plan)
+            plan = _adapt_plan(raw_plan, render_plan_path)
 
         # Guard 1: no shots at all (format mismatch or empty backgrounds list)
         if not manifest.shots:
@@ -408,7 +453,7 @@ def main() -> None:
 
         args.out_dir.mkdir(parents=True, exist_ok=True)
 
-        asset_manifest_ref = f"file://{args.asset_manifest.resolve()}"
+        asset_manifest_ref = f"file://{asset_manifest_path}"
         if args.verify:
             fp = PreviewRenderer(
                 manifest, plan, output_dir=args.out_dir,
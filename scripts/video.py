@@ -8,18 +8,22 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 _TOOLS_ROOT = Path(__file__).resolve().parents[1] / "tools"
 if str(_TOOLS_ROOT) not in sys.path:
     sys.path.insert(0, str(_TOOLS_ROOT))
 
-from tests._fixture_builders import build_minimal_verify_fixture
-from renderer.preview_local import PreviewRenderer
-from schemas.render_output import RenderAudit
+# Renderer / schema modules (pydantic, Pillow) are imported inside the
+# command functions so `video.py --help` and argument errors stay fast.
+if TYPE_CHECKING:
+    from schemas.render_output import RenderFingerprint
 
 _SKIP_RENDER_OUTPUT_FIELDS = frozenset({
     "rendered_at",      # wall-clock timestamp — intentionally non-deterministic
@@ -40,6 +44,12 @@ _CLI_TO_PLAN_PROFILE: dict[str, str] = {
     "high": "high",
 }
 
+# SHA-256 digests of fingerprints from verify runs that passed, keyed by
+# _fingerprint_cache_key().  A cache hit stands in for the second render: the
+# fresh run is compared against a fingerprint produced by an earlier,
+# independent process.
+_FP_CACHE_DIR = Path(tempfile.gettempdir()) / "video_verify_cache"
+
 
 def _diff_json(
     a: dict,
@@ -78,6 +88,8 @@ def cmd_audit_render(
     Writes RenderAudit JSON to stdout. Returns 0 if pass, 1 if fail or error.
     """
     import json as _json
+    from renderer.preview_local import PreviewRenderer
+    from schemas.render_output import RenderAudit
     errors: list[str] = []
     diff_fields: list[str] = []
 
@@ -127,45 +139,131 @@ def cmd_audit_render(
     return 0 if not diff_fields else 1
 
 
-def _fingerprint_bytes(out_dir: Path, profile: str = "preview") -> bytes:
-    """Run verify() on the minimal fixture; return render_fingerprint.json bytes."""
+def _verify_tmpdir() -> tempfile.TemporaryDirectory:
+    """Scratch parent dir for verify runs — on /dev/shm (tmpfs) when available.
+
+    The rendered mp4 is written once and read straight back for hashing, so
+    keeping it in RAM avoids a disk round trip where /tmp is not tmpfs.
+    A failed cleanup must not turn a passing verify into an error.
+    """
+    shm = Path("/dev/shm")
+    base = str(shm) if shm.is_dir() and os.access(shm, os.W_OK) else None
+    return tempfile.TemporaryDirectory(dir=base, ignore_cleanup_errors=True)
+
+
+def _fingerprint(
+    out_dir: Path, profile: str = "preview"
+) -> tuple[bytes, RenderFingerprint]:
+    """Run verify() on the minimal fixture; return (fingerprint file bytes, model)."""
+    from renderer.preview_local import PreviewRenderer
+    from tests._fixture_builders import build_minimal_verify_fixture
     manifest, plan = build_minimal_verify_fixture(
         profile=_CLI_TO_PLAN_PROFILE[profile]
     )
-    PreviewRenderer(
+    fp = PreviewRenderer(
         manifest, plan,
         output_dir=out_dir,
         asset_manifest_ref="file:///asset_manifest.json",
         dry_run=False,
     ).verify()
-    return (out_dir / "render_fingerprint.json").read_bytes()
+    return (out_dir / "render_fingerprint.json").read_bytes(), fp
+
+
+def _fingerprint_bytes(out_dir: Path, profile: str = "preview") -> bytes:
+    """Run verify() on the minimal fixture; return render_fingerprint.json bytes."""
+    return _fingerprint(out_dir, profile=profile)[0]
+
+
+def _fingerprint_cache_key(profile: str) -> str:
+    """SHA-256 over everything that determines the fingerprint bytes.
+
+    Covers the profile, the ffmpeg and Pillow versions, the fixture manifest
+    + plan, the placeholder font, and the renderer and schema sources, so any
+    change to the render path misses the cache.
+    """
+    import PIL
+    import renderer
+    import schemas
+    from renderer.ffmpeg_runner import get_ffmpeg_version
+    from tests._fixture_builders import build_minimal_verify_fixture
+    manifest, plan = build_minimal_verify_fixture(
+        profile=_CLI_TO_PLAN_PROFILE[profile]
+    )
+    font_path = Path(plan.fallback.placeholder_font_path)
+    h = hashlib.sha256()
+    for part in (profile, get_ffmpeg_version(), PIL.__version__,
+                 manifest.model_dump_json(), plan.model_dump_json(),
+                 str(font_path)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    if font_path.is_file():
+        h.update(font_path.read_bytes())
+    for pkg in (renderer, schemas):
+        for src in sorted(Path(pkg.__file__).parent.glob("*.py")):
+            h.update(src.read_bytes())
+    return h.hexdigest()
 
 
-def cmd_verify(strict: bool = False, profile: str = "preview") -> int:
+def cmd_verify(
+    strict: bool = False,
+    profile: str = "preview",
+    use_cache: bool = True,
+) -> int:
     """
     System verification export.
     Runs verify() twice on the minimal fixture, compares fingerprint bytes,
     and checks pinned mp4/srt hashes.
     Returns 0 on success, 1 on failure.
+
+    The two runs are independent (separate tempdirs) and spend nearly all of
+    their time inside ffmpeg subprocesses, so they execute concurrently.
+    With *use_cache*, the fingerprint digest cached by an earlier passing
+    verify replaces the second run.  A cached digest that does not match the
+    first run is treated as stale, not as nondeterminism: the second run is
+    rendered for real and only a live mismatch fails.  The cache is written
+    whenever two live runs agree and every check passes.
     """
     pinned_mp4 = _PINNED_MP4_SHA256.get(profile)
     errors: list[str] = []
     try:
-        with (tempfile.TemporaryDirectory() as d1,
-              tempfile.TemporaryDirectory() as d2):
-            b1 = _fingerprint_bytes(Path(d1), profile=profile)
-            b2 = _fingerprint_bytes(Path(d2), profile=profile)
+        cache_path: Path | None = None
+        cached: bytes | None = None
+        if use_cache:
+            cache_path = _FP_CACHE_DIR / f"{_fingerprint_cache_key(profile)}.sha256"
+            if cache_path.exists():
+                cached = cache_path.read_bytes()
 
-            if b1 != b2:
-                errors.append("fingerprint JSON bytes differ between runs")
+        # One tempdir holds both runs: a single mkdtemp and a single rmtree.
+        with (_verify_tmpdir() as parent,
+              ThreadPoolExecutor(max_workers=2) as pool):
+            d1, d2 = Path(parent, "a"), Path(parent, "b")
+            d1.mkdir()
+            d2.mkdir()
+            f1 = pool.submit(_fingerprint, d1, profile=profile)
+            f2 = None
+            if cached is None:
+                f2 = pool.submit(_fingerprint, d2, profile=profile)
+            # Pinned-hash checks read the model verify() returned — no re-parse.
+            b1, fp = f1.result()
 
-            fp = json.loads(b1)
+            # Runs are compared by digest so the cache only has to keep 32 bytes.
+            digest1 = hashlib.sha256(b1).digest()
+            if f2 is None and digest1 != cached:
+                # Stale entry (something outside the key changed the output):
+                # settle it with a real second run rather than failing.
+                f2 = pool.submit(_fingerprint, d2, profile=profile)
+            if f2 is None:
+                digest2 = cached
+            else:
+                digest2 = hashlib.sha256(f2.result()[0]).digest()
+            if digest1 != digest2:
+                errors.append("fingerprint JSON bytes differ between runs")
 
             # mp4 check — warn only unless --strict
-            if pinned_mp4 and fp.get("mp4_sha256") != pinned_mp4:
+            if pinned_mp4 and fp.mp4_sha256 != pinned_mp4:
                 msg = (
                     f"mp4_sha256 mismatch: expected {pinned_mp4}, "
-                    f"got {fp.get('mp4_sha256')}"
+                    f"got {fp.mp4_sha256}"
                 )
                 if strict:
                     errors.append(msg)
@@ -173,11 +271,17 @@ def cmd_verify(strict: bool = False, profile: str = "preview") -> int:
                     print(f"  WARNING: {msg}", file=sys.stderr)
 
             # srt check — always hard fail
-            if fp.get("srt_sha256") != _PINNED_SRT_SHA256:
+            if fp.srt_sha256 != _PINNED_SRT_SHA256:
                 errors.append(
                     f"srt_sha256 mismatch: expected {_PINNED_SRT_SHA256}, "
-                    f"got {fp.get('srt_sha256')}"
+                    f"got {fp.srt_sha256}"
                 )
+
+            if cache_path is not None and f2 is not None and not errors:
+                _FP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(digest1)
+                os.replace(tmp, cache_path)   # atomic vs. concurrent verifies
     except Exception as exc:
         errors.append(str(exc))
 
@@ -203,6 +307,10 @@ def main() -> None:
         "--profile", default="preview", choices=["preview", "high"],
         help="Quality profile (default: preview)",
     )
+    verify_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Always render twice; ignore and do not update the fingerprint cache",
+    )
     audit_parser = sub.add_parser("audit-render", help="Detect nondeterminism in a render")
     audit_parser.add_argument("render_plan",    help="Path to RenderPlan JSON")
     audit_parser.add_argument("asset_manifest", help="Path to AssetManifest JSON")
@@ -212,7 +320,9 @@ def main() -> None:
     )
     args = parser.parse_args()
     if args.command == "verify":
-        sys.exit(cmd_verify(strict=args.strict, profile=args.profile))
+        sys.exit(cmd_verify(
+            strict=args.strict, profile=args.profile, use_cache=not args.no_cache,
+        ))
     elif args.command == "audit-render":
         sys.exit(cmd_audit_render(
             args.render_plan, args.asset_manifest, dry_run=args.dry_run,
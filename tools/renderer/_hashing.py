@@ -0,0 +1,60 @@
+"""
+SHA-256 helpers shared by the renderer and its tests.
+
+Every content / lineage hash the renderer records goes through this module so
+the hashing strategy (mmap for files, canonical JSON for models) lives in one
+place.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# SHA-256 of zero bytes — e.g. the captions hash whenever no VO lines exist.
+SHA256_EMPTY = hashlib.sha256(b"").hexdigest()
+
+
+def canonical_json_bytes(obj: dict) -> bytes:
+    """Canonical JSON encoding — sorted keys, compact separators, UTF-8."""
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def sha256_bytes(data: bytes) -> str:
+    """Hex SHA-256 of *data*."""
+    return hashlib.sha256(data).hexdigest() if data else SHA256_EMPTY
+
+
+def sha256_text(text: str) -> str:
+    """Hex SHA-256 of *text* encoded as UTF-8."""
+    return sha256_bytes(text.encode("utf-8"))
+
+
+def sha256_file(path: Path) -> str:
+    """Hex SHA-256 of the file at *path*."""
+    # Hash the whole file through a read-only mapping: one update() call and
+    # no copy into a userspace buffer.  mmap rejects empty files.
+    with open(path, "rb") as fh:
+        fd = fh.fileno()
+        if os.fstat(fd).st_size == 0:
+            return SHA256_EMPTY
+        if hasattr(os, "posix_fadvise"):   # Linux; absent on macOS / Windows
+            # Advice values are not bit flags — one call each.  Sequential
+            # readahead keeps the page-fault path from stalling on cold pages.
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def sha256_model(model: BaseModel) -> str:
+    """Hex SHA-256 of the canonical JSON of a Pydantic model's dump."""
+    return sha256_bytes(canonical_json_bytes(model.model_dump()))
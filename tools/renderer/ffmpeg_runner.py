@@ -9,6 +9,7 @@ See video/tools/README.md for version pinning guidance.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -23,6 +24,11 @@ logger = logging.getLogger(__name__)
 # a different encoder version may produce different bitstreams.
 FFMPEG_MIN_VERSION = "6.1"
 
+# Hardware H.264 encoders in preference order.  Each accepts yuv420p frames
+# from system memory, so the software filter graph is reused unchanged.
+# (h264_vaapi is omitted: it needs a device + hwupload in the filter graph.)
+HW_H264_ENCODERS: tuple[str, ...] = ("h264_videotoolbox", "h264_nvenc", "h264_qsv")
+
 
 class FFmpegError(Exception):
     """FFmpeg subprocess exited with a non-zero return code."""
@@ -36,10 +42,14 @@ class FFmpegNotFound(Exception):
 # Version helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_version() -> str:
     """
     Return the installed ffmpeg version string (e.g. "6.1.1").
 
+    Cached for the life of the process — the binary on PATH does not change
+    between renders, and each probe costs a fork+exec.  Failures are not cached.
+
     Raises:
         FFmpegNotFound: if ffmpeg is not on PATH or fails to respond.
     """
@@ -67,6 +77,39 @@ def get_ffmpeg_version() -> str:
     return first_line
 
 
+@functools.lru_cache(maxsize=1)
+def detect_hw_encoder() -> Optional[str]:
+    """
+    Return the first entry of HW_H264_ENCODERS that ffmpeg was built with.
+
+    Being listed by `ffmpeg -encoders` does not guarantee the device is
+    present; callers must be ready to fall back to libx264 if the encode fails.
+
+    Returns:
+        Encoder name, or None if none is available or ffmpeg cannot be probed.
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return None
+
+    # Encoder lines look like: " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    available = {
+        parts[1] for parts in (ln.split() for ln in result.stdout.splitlines())
+        if len(parts) >= 2
+    }
+    for encoder in HW_H264_ENCODERS:
+        if encoder in available:
+            return encoder
+    return None
+
+
 def validate_ffmpeg() -> str:
     """
     Validate that ffmpeg is present and warn if below minimum version.
@@ -2,8 +2,9 @@
 Placeholder PNG generator for missing visual assets.
 
 Generates solid-color 'shot_id + PLACEHOLDER' images using Pillow.
-Output is deterministic: identical (shot_id, width, height, color) always
-produces a bit-identical PNG across repeated calls (cached by content hash).
+Output is deterministic: identical (shot_id, width, height, color, label,
+font) always produces a bit-identical PNG across repeated calls (cached by
+content hash, so a cache_dir may be shared between runs and processes).
 
 No ffmpeg dependency — Pillow only.
 Pillow is already a worker dependency (Pillow ^10.2.0 in worker/pyproject.toml).
@@ -12,6 +13,8 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 # Pillow is required; guard import for environments where it may be absent.
 try:
+    import PIL
     from PIL import Image, ImageDraw, ImageFont
     _PIL_AVAILABLE = True
 except ImportError:  # pragma: no cover
@@ -73,9 +77,11 @@ def generate_placeholder(
     if output_path is None:
         if cache_dir is None:
             raise ValueError("Either output_path or cache_dir must be provided.")
-        # Deterministic cache filename: hash of the key inputs.
+        # Deterministic cache filename: hash of every input that affects the
+        # PNG bytes, including the Pillow version (see Determinism guarantee).
         key = hashlib.sha256(
-            f"{shot_id}|{width}|{height}|{color}".encode()
+            f"{shot_id}|{width}|{height}|{color}|{label}|{font_path}|{font_size}"
+            f"|{PIL.__version__}".encode()
         ).hexdigest()[:16]
         cache_dir = Path(cache_dir)
         cache_dir.mkdir(parents=True, exist_ok=True)
@@ -129,7 +135,15 @@ def generate_placeholder(
 
     # --- Save PNG ---
     # compress_level=9 with optimize=False is deterministic for the same Pillow version.
-    img.save(str(output_path), format="PNG", compress_level=9, optimize=False)
+    # Written under a temp name and renamed so concurrent renders sharing a
+    # cache_dir never read a half-written PNG.  The temp name is unique per
+    # process and thread: concurrent renders (cmd_verify runs two) may write
+    # the same placeholder at once.
+    tmp_path = output_path.with_name(
+        f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    img.save(str(tmp_path), format="PNG", compress_level=9, optimize=False)
+    os.replace(tmp_path, output_path)
     logger.debug("Generated placeholder: %s (%dx%d)", output_path, width, height)
     return output_path
 
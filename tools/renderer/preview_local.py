@@ -24,9 +24,10 @@ from __future__ import annotations
 
 import datetime
 import hashlib
-import json
 import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
@@ -43,16 +44,33 @@ from schemas.render_output import (
     RenderFingerprint,
     RenderOutput,
 )
+from renderer._hashing import (
+    canonical_json_bytes,
+    sha256_bytes,
+    sha256_file,
+)
 from renderer.captions import write_srt
-from renderer.ffmpeg_runner import FFmpegError, run_ffmpeg, validate_ffmpeg
+from renderer.ffmpeg_runner import (
+    FFmpegError,
+    detect_hw_encoder,
+    run_ffmpeg,
+    validate_ffmpeg,
+)
 from renderer.placeholder import generate_placeholder
 
 logger = logging.getLogger(__name__)
 
 _PROFILE_SETTINGS: dict[str, dict[str, str]] = {
-    "preview": {"crf": "28", "preset": "medium"},
-    "high":    {"crf": "18", "preset": "slow"},
+    "preview": {"crf": "28", "preset": "medium", "hw_bitrate": "4M"},
+    "high":    {"crf": "18", "preset": "slow",   "hw_bitrate": "12M"},
 }
+_SW_ENCODER = "libx264"
+# Opt-in: RENDER_ALLOW_HW=1 lets render() use a hardware H.264 encoder.
+# Hardware output is not bit-reproducible, so verify() always uses libx264.
+_HW_ENV_VAR = "RENDER_ALLOW_HW"
+# Optional persistent placeholder cache shared across runs.  Placeholders are
+# keyed by their drawing inputs and the Pillow version that wrote them.
+_PLACEHOLDER_CACHE_ENV_VAR = "RENDER_PLACEHOLDER_CACHE"
 _PROFILE_ALIASES: dict[str, str] = {
     "preview_local": "preview",   # Phase-0 backward-compat alias
 }
@@ -113,20 +131,32 @@ class PreviewRenderer:
         self._asset_manifest_ref = asset_manifest_ref
         self.dry_run = dry_run
 
-        # Pre-compute canonical lineage hashes once; reused by render() to
-        # avoid double-serialisation and to derive stable IDs.
-        self._manifest_hash = _canonical_json_hash(self.manifest.model_dump())
-        self._plan_hash = _canonical_json_hash(self.plan.model_dump())
+        # Pre-compute canonical JSON + lineage hashes once; reused by render()
+        # and _compute_inputs_digest() to avoid re-serialisation and to derive
+        # stable IDs.
+        self._manifest_json = canonical_json_bytes(self.manifest.model_dump())
+        self._plan_json = canonical_json_bytes(self.plan.model_dump())
+        self._manifest_hash = sha256_bytes(self._manifest_json)
+        self._plan_hash = sha256_bytes(self._plan_json)
         # Stable render/request identity derived from inputs, not a random UUID.
         self._derived_id = hashlib.sha256(
             f"{self._manifest_hash}:{self._plan_hash}".encode("utf-8")
         ).hexdigest()
         self.request_id = request_id or self._derived_id
 
+        # Plain-attribute copies of the plan/manifest fields read per shot.
+        self._width = plan.resolution.width
+        self._height = plan.resolution.height
+        self._fps = plan.fps
+        self._shots = list(manifest.shots)
+
         # Fail fast: validate ffmpeg presence and version before any work starts.
         # Skip the check in dry-run mode — no subprocess will be executed.
         self._ffmpeg_version = "dry-run" if dry_run else validate_ffmpeg()
         self._placeholder_count = 0
+        self._encoder = _SW_ENCODER
+        if not dry_run and os.environ.get(_HW_ENV_VAR) == "1":
+            self._encoder = detect_hw_encoder() or _SW_ENCODER
 
     # ------------------------------------------------------------------
     # Public
@@ -166,15 +196,18 @@ class PreviewRenderer:
             return self._dry_run_output()
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        placeholder_dir = self.output_dir / ".placeholders"
-        placeholder_dir.mkdir(exist_ok=True)
+        placeholder_dir = Path(
+            os.environ.get(_PLACEHOLDER_CACHE_ENV_VAR)
+            or self.output_dir / ".placeholders"
+        )
+        placeholder_dir.mkdir(parents=True, exist_ok=True)
 
         ffmpeg_version = self._ffmpeg_version   # already validated at __init__
         logger.info(
             "PreviewRenderer | project=%s | ffmpeg=%s | shots=%d",
             self.manifest.project_id,
             ffmpeg_version,
-            len(self.manifest.shots),
+            len(self._shots),
         )
 
         # Lineage hashes: canonical JSON (sorted keys, compact separators, UTF-8).
@@ -189,26 +222,35 @@ class PreviewRenderer:
         output_mp4 = self.output_dir / "output.mp4"
         self._run_concat(shot_inputs, output_mp4)
 
-        # Step 3 — generate SRT captions.
+        # Steps 3 + 4 — generate SRT captions and compute content hashes.
+        # The mp4 hash runs on a worker thread (hashlib releases the GIL on
+        # large buffers) while captions are written and hashed here.
+        # The .srt is written as UTF-8, so hashing its raw bytes equals
+        # sha256_text() of the content without a decode/re-encode round trip.
         output_srt = self.output_dir / "output.srt"
-        write_srt(self.manifest, output_srt)
-
-        # Step 4 — compute content hashes.
-        video_hash = _sha256_file(output_mp4)
-        captions_hash = _sha256_text(output_srt.read_text(encoding="utf-8"))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            video_future = pool.submit(sha256_file, output_mp4)
+            write_srt(self.manifest, output_srt)
+            captions_hash = sha256_bytes(output_srt.read_bytes())
+            video_hash = video_future.result()
 
         # Step 5 — assemble RenderOutput.
+        # model_construct() skips validation: every field below is produced by
+        # this renderer (hashes, derived IDs, validated manifest/plan values),
+        # so re-validating it is pure overhead.  Untrusted inputs (AssetManifest,
+        # RenderPlan) are still fully validated on load.
         _ps = _PROFILE_SETTINGS[self._profile]
-        effective = EffectiveSettings(
-            resolution=f"{self.plan.resolution.width}x{self.plan.resolution.height}",
-            fps=str(self.plan.fps),
+        _sw = self._encoder == _SW_ENCODER   # crf/preset only apply to libx264
+        effective = EffectiveSettings.model_construct(
+            resolution=f"{self._width}x{self._height}",
+            fps=str(self._fps),
             audio_rate="aac" if _resolve_music(self.manifest) else "none",
-            encoder="libx264",
-            crf=_ps["crf"],
-            preset=_ps["preset"],
+            encoder=self._encoder,
+            crf=_ps["crf"] if _sw else None,
+            preset=_ps["preset"] if _sw else None,
             profile=self._profile,
         )
-        result = RenderOutput(
+        result = RenderOutput.model_construct(
             schema_version="0.0.1",
             schema_id="RenderOutput",
             output_id=self._derived_id,   # stable: sha256(manifest_hash:plan_hash)
@@ -218,28 +260,28 @@ class PreviewRenderer:
             video_uri=f"file://{output_mp4.resolve()}",
             captions_uri=f"file://{output_srt.resolve()}",
             audio_stems_uri=None,
-            hashes=OutputHashes(
+            hashes=OutputHashes.model_construct(
                 video_sha256=video_hash,
                 captions_sha256=captions_hash,
             ),
-            provenance=Provenance(
+            provenance=Provenance.model_construct(
                 render_profile=self._profile,
                 timing_lock_hash=self.plan.timing_lock_hash,
                 rendered_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
                 ffmpeg_version=ffmpeg_version,
                 placeholder_count=self._placeholder_count,
             ),
-            lineage=Lineage(
+            lineage=Lineage.model_construct(
                 asset_manifest_hash=manifest_hash,
                 render_plan_hash=plan_hash,
             ),
             outputs=[
-                OutputArtifact(
+                OutputArtifact.model_construct(
                     type="video",
                     path=str(output_mp4.resolve()),
                     sha256=video_hash,
                 ),
-                OutputArtifact(
+                OutputArtifact.model_construct(
                     type="captions",
                     path=str(output_srt.resolve()),
                     sha256=captions_hash,
@@ -247,7 +289,7 @@ class PreviewRenderer:
             ],
             effective_settings=effective,
             inputs_digest=self._compute_inputs_digest(effective),
-            producer=Producer(),
+            producer=Producer.model_construct(),
         )
 
         output_json = self.output_dir / "render_output.json"
@@ -292,7 +334,14 @@ class PreviewRenderer:
                 ro_path.read_text(encoding="utf-8")
             )
         else:
-            full_result = self.render()
+            # Fingerprints pin libx264 output; later render() calls on this
+            # instance keep the encoder the caller opted into.
+            encoder = self._encoder
+            self._encoder = _SW_ENCODER
+            try:
+                full_result = self.render()
+            finally:
+                self._encoder = encoder
 
         # Step 3: per-frame MD5s (deterministic for bit-identical mp4)
         frame_hashes = _extract_frame_hashes(mp4_path)
@@ -321,8 +370,8 @@ class PreviewRenderer:
         music_path = _resolve_music(self.manifest)
         _ps = _PROFILE_SETTINGS[self._profile]
         effective = EffectiveSettings(
-            resolution=f"{self.plan.resolution.width}x{self.plan.resolution.height}",
-            fps=str(self.plan.fps),
+            resolution=f"{self._width}x{self._height}",
+            fps=str(self._fps),
             audio_rate="aac" if music_path else "none",
             encoder="libx264",
             crf=_ps["crf"],
@@ -369,14 +418,11 @@ class PreviewRenderer:
 
         Same canonicalisation as _canonical_json_hash(): sorted keys, compact
         separators, UTF-8.  Order is fixed: plan → manifest → effective_settings.
+        Plan and manifest bytes are the ones serialised once in __init__.
         """
-        h = hashlib.sha256()
-        for obj in (self.plan, self.manifest, effective):
-            blob = json.dumps(
-                obj.model_dump(), sort_keys=True,
-                separators=(",", ":"), ensure_ascii=False,
-            )
-            h.update(blob.encode("utf-8"))
+        h = hashlib.sha256(self._plan_json)
+        h.update(self._manifest_json)
+        h.update(canonical_json_bytes(effective.model_dump()))
         return h.hexdigest()
 
     # ------------------------------------------------------------------
@@ -385,11 +431,11 @@ class PreviewRenderer:
 
     def _resolve_shot_inputs(self, placeholder_dir: Path) -> list[Path]:
         """Return one resolved image Path per shot, in shot-index order."""
-        w = self.plan.resolution.width
-        h = self.plan.resolution.height
+        w = self._width
+        h = self._height
         return [
             self._get_shot_visual(shot, placeholder_dir, w, h)
-            for shot in self.manifest.shots
+            for shot in self._shots
         ]
 
     def _get_shot_visual(
@@ -459,15 +505,15 @@ class PreviewRenderer:
           -movflags +faststart     consistent MP4 atom ordering
           (libx264 is deterministic for fixed crf/preset/pix_fmt/fps)
         """
-        w = self.plan.resolution.width
-        h = self.plan.resolution.height
-        fps = self.plan.fps
+        w = self._width
+        h = self._height
+        fps = self._fps
         n = len(shot_inputs)
 
         cmd: list[str] = ["ffmpeg", "-y"]
 
         # --- Video inputs ---
-        for shot, path in zip(self.manifest.shots, shot_inputs):
+        for shot, path in zip(self._shots, shot_inputs):
             dur_s = shot.duration_ms / 1000.0
             cmd += [
                 "-loop", "1",
@@ -482,17 +528,15 @@ class PreviewRenderer:
             cmd += ["-i", str(music_path)]
 
         # --- filter_complex: scale + pad each video input, then concat ---
-        total_dur_s = sum(s.duration_ms for s in self.manifest.shots) / 1000.0
-        filter_parts: list[str] = []
-        for i in range(n):
-            filter_parts.append(
-                f"[{i}:v]"
-                f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
-                f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:black,"
-                f"setsar=1,"
-                f"fps={fps}"
-                f"[v{i}]"
-            )
+        total_dur_s = sum(s.duration_ms for s in self._shots) / 1000.0
+        # The per-shot chain only differs by input index: format it once.
+        chain = (
+            f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:black,"
+            f"setsar=1,"
+            f"fps={fps}"
+        )
+        filter_parts = [f"[{i}:v]{chain}[v{i}]" for i in range(n)]
         concat_in = "".join(f"[v{i}]" for i in range(n))
         filter_parts.append(f"{concat_in}concat=n={n}:v=1:a=0[vout]")
 
@@ -519,11 +563,14 @@ class PreviewRenderer:
         #   -fflags +bitexact / -flags:v +bitexact — suppress non-reproducible metadata
         #   -map_metadata -1                        — strip creation_time, encoder strings
         #   -movflags +faststart                    — consistent MP4 atom ordering
+        # With RENDER_ALLOW_HW=1 a hardware encoder replaces libx264 and
+        # targets a bitrate instead of CRF (see _PROFILE_SETTINGS).
         _ps = _PROFILE_SETTINGS[self._profile]
+        if self._encoder == _SW_ENCODER:
+            cmd += ["-c:v", _SW_ENCODER, "-crf", _ps["crf"], "-preset", _ps["preset"]]
+        else:
+            cmd += ["-c:v", self._encoder, "-b:v", _ps["hw_bitrate"]]
         cmd += [
-            "-c:v", "libx264",
-            "-crf", _ps["crf"],
-            "-preset", _ps["preset"],
             "-pix_fmt", "yuv420p",  # Phase-0 constant
             "-r", str(fps),
             "-fflags", "+bitexact",
@@ -533,7 +580,18 @@ class PreviewRenderer:
             str(output_path),
         ]
 
-        run_ffmpeg(cmd)
+        try:
+            run_ffmpeg(cmd)
+        except FFmpegError:
+            if self._encoder == _SW_ENCODER:
+                raise
+            # Listed by `ffmpeg -encoders` but no usable device — retry in software.
+            logger.warning(
+                "Hardware encoder %s failed — falling back to %s.",
+                self._encoder, _SW_ENCODER,
+            )
+            self._encoder = _SW_ENCODER
+            self._run_concat(shot_inputs, output_path)
 
 
 # ---------------------------------------------------------------------------
@@ -571,20 +629,7 @@ def _canonical_json_hash(obj: dict) -> str:
     order or serialisation library internals (e.g. model_dump_json() key order
     is not guaranteed to be stable across Pydantic versions).
     """
-    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-
-
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65_536), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return sha256_bytes(canonical_json_bytes(obj))
 
 
 def _extract_frame_hashes(mp4_path: Path) -> list[str]:
@@ -4,7 +4,8 @@ Shared pytest fixtures for video/tools/tests/.
 Provides:
   - deterministic test PNG assets (generated with Pillow, not committed binaries)
   - pre-built AssetManifest and RenderPlan objects for the 5-shot golden fixture
-  - require_ffmpeg: skip-marker for tests that need the ffmpeg binary
+  - require_pillow / require_ffmpeg: skip-markers for tests that need Pillow /
+    the ffmpeg binary
 """
 from __future__ import annotations
 
@@ -204,9 +205,16 @@ def sample_plan(test_assets_dir: Path):
 
 
 # ---------------------------------------------------------------------------
-# FFmpeg availability check
+# Pillow / FFmpeg availability checks
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def require_pillow():
+    """Skip the test if Pillow is not installed."""
+    if not _PIL_AVAILABLE:
+        pytest.skip("Pillow not installed")
+
+
 @pytest.fixture(scope="session")
 def require_ffmpeg():
     """Skip the test if ffmpeg is not available on PATH."""
@@ -0,0 +1,61 @@
+"""
+Shared fixtures for the scripts/video.py integration tests.
+
+Provides:
+  - video_mod:  scripts/video.py loaded once per session
+  - verify_run: in-process `video verify` result, once per profile per session
+  - baseline_fingerprint: one real preview verify() (bytes, model) to reuse
+"""
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+VIDEO_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "video.py"
+
+
+class CliResult(NamedTuple):
+    """cmd_verify() outcome in subprocess.CompletedProcess shape."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def run_cmd_verify(video_mod, **kwargs) -> CliResult:
+    """Call cmd_verify() in-process, capturing what the CLI would print."""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        rc = video_mod.cmd_verify(**kwargs)
+    return CliResult(rc, out.getvalue(), err.getvalue())
+
+
+@pytest.fixture(scope="session")
+def video_mod(require_pillow):
+    spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session", params=["preview", "high"])
+def verify_run(request, require_ffmpeg, video_mod) -> CliResult:
+    """`video verify --profile <param>`; the default profile is preview.
+
+    Runs with the fingerprint cache off: a real $TMPDIR/video_verify_cache
+    entry would otherwise stand in for the second render, and a passing run
+    would write one there.
+    """
+    return run_cmd_verify(video_mod, profile=request.param, use_cache=False)
+
+
+@pytest.fixture(scope="session")
+def baseline_fingerprint(require_ffmpeg, video_mod, tmp_path_factory):
+    """(render_fingerprint.json bytes, RenderFingerprint) of one preview verify()."""
+    return video_mod._fingerprint(
+        tmp_path_factory.mktemp("baseline_fp"), profile="preview"
+    )
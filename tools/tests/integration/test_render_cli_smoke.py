@@ -10,7 +10,6 @@ class via the class-scoped ``cli_out`` fixture.
 """
 from __future__ import annotations
 
-import hashlib
 import json
 import subprocess
 import sys
@@ -18,23 +17,9 @@ from pathlib import Path
 
 import pytest
 
-SMOKE_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "render_from_orchestrator.py"
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65_536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+from renderer._hashing import sha256_file, sha256_text
 
-
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+SMOKE_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "render_from_orchestrator.py"
 
 
 # ---------------------------------------------------------------------------
@@ -118,12 +103,12 @@ class TestRenderCliSmoke:
 
     def test_video_sha256_matches(self, cli_out):
         data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
-        actual = _sha256_file(cli_out["out_dir"] / "output.mp4")
+        actual = sha256_file(cli_out["out_dir"] / "output.mp4")
         assert data["hashes"]["video_sha256"] == actual
 
     def test_captions_sha256_matches(self, cli_out):
         data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
-        actual = _sha256_text(
+        actual = sha256_text(
             (cli_out["out_dir"] / "output.srt").read_text(encoding="utf-8")
         )
         assert data["hashes"]["captions_sha256"] == actual
@@ -4,11 +4,11 @@ Requires ffmpeg + Pillow. Marked @pytest.mark.slow.
 """
 from __future__ import annotations
 
-import importlib
-import importlib.util
+import itertools
 import json
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -17,22 +17,13 @@ VIDEO_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "video.py"
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_pillow")
 class TestVideoVerifyCli:
+    """`video verify` for each profile (session-scoped verify_run, see conftest)."""
 
     @pytest.fixture(autouse=True)
     def _need_ffmpeg(self, require_ffmpeg): ...
 
-    @pytest.fixture(scope="class")
-    def verify_run(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        return subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "verify"],
-            capture_output=True, text=True,
-        )
-
     def test_exit_code_zero(self, verify_run):
         assert verify_run.returncode == 0, (
             f"video verify failed:\nSTDOUT: {verify_run.stdout}\n"
@@ -48,99 +39,84 @@ class TestVideoVerifyCli:
     def test_unknown_command_exits_nonzero(self):
         result = subprocess.run(
             [sys.executable, str(VIDEO_SCRIPT), "bogus"],
-            capture_output=True, text=True,
+            capture_output=True,   # only the exit code matters: no decoding
         )
         assert result.returncode != 0
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_pillow")
 class TestVideoVerifyDeterminismFailure:
-    """Verify that a corrupted frame hash causes cmd_verify() to fail."""
+    """A corrupted frame hash fails cmd_verify(); a stale cache entry does not."""
 
     @pytest.fixture(autouse=True)
     def _need_ffmpeg(self, require_ffmpeg): ...
 
-    def test_frame_hash_corruption_exits_nonzero(self, monkeypatch, capsys):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-
-        # Load video module so its globals (e.g. _fingerprint_bytes) are fresh
-        spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
-        video_mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(video_mod)
-
-        from renderer.preview_local import PreviewRenderer
-
-        original_verify = PreviewRenderer.verify
-        call_count = 0
-
-        def patched_verify(self):
-            nonlocal call_count
-            result = original_verify(self)
-            call_count += 1
-            if call_count >= 2:
-                fp_path = self.output_dir / "render_fingerprint.json"
-                data = json.loads(fp_path.read_bytes())
-                if data.get("frame_hashes"):
-                    data["frame_hashes"][0] = "CORRUPTED"
-                    fp_path.write_text(
-                        json.dumps(data, indent=2), encoding="utf-8"
-                    )
-            return result
-
-        monkeypatch.setattr(PreviewRenderer, "verify", patched_verify)
-
-        exit_code = video_mod.cmd_verify()
+    def test_frame_hash_corruption_exits_nonzero(
+        self, video_mod, baseline_fingerprint, monkeypatch, capsys,
+    ):
+        # Replay one real render for both runs instead of rendering twice;
+        # whichever run calls _fingerprint second reports a corrupted frame
+        # hash (the runs are concurrent, so which one is irrelevant).
+        fp_bytes, fp = baseline_fingerprint
+        data = json.loads(fp_bytes)
+        assert data.get("frame_hashes"), "baseline fingerprint has no frame hashes"
+        data["frame_hashes"][0] = "CORRUPTED"
+        corrupted = json.dumps(data, indent=2).encode("utf-8")
+
+        calls = itertools.count()
+        lock = threading.Lock()
+
+        def replayed_fingerprint(out_dir, profile="preview"):
+            with lock:
+                call = next(calls)
+            return (corrupted if call else fp_bytes), fp
+
+        monkeypatch.setattr(video_mod, "_fingerprint", replayed_fingerprint)
+
+        # Bypass the fingerprint cache so both runs are compared.
+        exit_code = video_mod.cmd_verify(use_cache=False)
         captured = capsys.readouterr()
 
+        assert next(calls) == 2, "cmd_verify should fingerprint exactly twice"
         assert exit_code == 1
         assert captured.out.strip() == "ERROR: video verification failed"
         assert "fingerprint JSON bytes differ" in captured.err
 
+    def test_stale_cache_entry_is_refreshed(
+        self, video_mod, monkeypatch, capsys, tmp_path,
+    ):
+        """A cached digest that no longer matches triggers a real second run
+        and is overwritten, instead of failing every later verify."""
+        monkeypatch.setattr(video_mod, "_FP_CACHE_DIR", tmp_path)
+        key = video_mod._fingerprint_cache_key("preview")
+        entry = tmp_path / f"{key}.sha256"
+        entry.write_bytes(bytes(32))
+
+        exit_code = video_mod.cmd_verify()
+        captured = capsys.readouterr()
+
+        assert exit_code == 0
+        assert captured.out.strip() == "OK: video verified"
+        assert entry.read_bytes() != bytes(32)
+        assert len(entry.read_bytes()) == 32
+
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_pillow")
 class TestVideoVerifyProfile:
-    """Test --profile flag for both preview and high profiles."""
+    """Test --profile flag for both preview and high profiles.
+
+    Exit code / stdout per profile are covered by TestVideoVerifyCli, whose
+    verify_run fixture is parametrized over preview and high.
+    """
 
     @pytest.fixture(autouse=True)
     def _need_ffmpeg(self, require_ffmpeg): ...
 
-    def test_profile_preview_explicit_exits_zero(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "verify", "--profile", "preview"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0, result.stderr
-        assert result.stdout.strip() == "OK: video verified"
-
-    def test_profile_high_exits_zero(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "verify", "--profile", "high"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0, result.stderr
-        assert result.stdout.strip() == "OK: video verified"
-
-    def test_preview_and_high_fingerprints_differ(self, tmp_path):
+    def test_preview_and_high_fingerprints_differ(self, video_mod, tmp_path):
         """Preview and high profiles must produce different fingerprint bytes."""
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
         import tempfile
-        spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
-        video_mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(video_mod)
         with (tempfile.TemporaryDirectory() as dp,
               tempfile.TemporaryDirectory() as dh):
             bp = video_mod._fingerprint_bytes(Path(dp), profile="preview")
@@ -149,6 +125,7 @@ class TestVideoVerifyProfile:
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_pillow")
 class TestVideoAuditRenderCli:
     """Tests for `video audit-render` subcommand."""
 
@@ -158,10 +135,6 @@ class TestVideoAuditRenderCli:
     @pytest.fixture(scope="class")
     def fixture_files(self, tmp_path_factory):
         """Write the minimal fixture manifest+plan to disk for CLI consumption."""
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
         import sys; sys.path.insert(0, str(VIDEO_SCRIPT.parents[1] / "tools"))
         from tests._fixture_builders import build_minimal_verify_fixture
         manifest, plan = build_minimal_verify_fixture()
@@ -215,12 +188,13 @@ class TestVideoAuditRenderCli:
         result = subprocess.run(
             [sys.executable, str(VIDEO_SCRIPT), "audit-render",
              str(tmp_path / "missing.json"), str(tmp_path / "m.json")],
-            capture_output=True, text=True,
+            capture_output=True,   # only the exit code matters: no decoding
         )
         assert result.returncode != 0
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_pillow")
 class TestVideoVerifyHashPins:
     """
     T1: default render → mp4_sha256 == pinned_preview
@@ -235,17 +209,6 @@ class TestVideoVerifyHashPins:
     @pytest.fixture(autouse=True)
     def _need_ffmpeg(self, require_ffmpeg): ...
 
-    @pytest.fixture(scope="class")
-    def video_mod(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        return mod
-
     @pytest.fixture(scope="class")
     def default_fp(self, video_mod, tmp_path_factory):
         d = tmp_path_factory.mktemp("default_fp")
@@ -279,6 +242,7 @@ class TestVideoVerifyHashPins:
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_pillow")
 class TestVideoAuditRenderHighProfile:
     """T4 for high profile: audit-render proves RenderOutput.json + fingerprint are stable."""
 
@@ -287,10 +251,6 @@ class TestVideoAuditRenderHighProfile:
 
     @pytest.fixture(scope="class")
     def high_fixture_files(self, tmp_path_factory):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
         import sys; sys.path.insert(0, str(VIDEO_SCRIPT.parents[1] / "tools"))
         from tests._fixture_builders import build_minimal_verify_fixture
         manifest, plan = build_minimal_verify_fixture(profile="high")
@@ -93,6 +93,28 @@ class TestGeneratePlaceholder:
         assert path_a == path_b
         assert path_b.stat().st_mtime == mtime_a   # file was NOT regenerated
 
+    def test_cache_key_includes_font_size(self, tmp_path: Path):
+        """A shared cache must not return a placeholder rendered at another size."""
+        cache = tmp_path / "cache"
+        small = generate_placeholder(
+            shot_id="s1", width=320, height=180, font_size=12, cache_dir=cache,
+        )
+        large = generate_placeholder(
+            shot_id="s1", width=320, height=180, font_size=48, cache_dir=cache,
+        )
+        assert small != large
+        assert not list(cache.glob("*.tmp"))
+
+    def test_cache_key_includes_pillow_version(self, tmp_path: Path, monkeypatch):
+        """PNG bytes depend on the Pillow version, so an upgrade must miss."""
+        import PIL
+
+        cache = tmp_path / "cache"
+        current = generate_placeholder(shot_id="s1", width=320, height=180, cache_dir=cache)
+        monkeypatch.setattr(PIL, "__version__", "0.0.0")
+        other = generate_placeholder(shot_id="s1", width=320, height=180, cache_dir=cache)
+        assert current != other
+
     def test_no_output_path_and_no_cache_dir_raises(self):
         with pytest.raises(ValueError, match="output_path or cache_dir"):
             generate_placeholder(shot_id="s1", width=100, height=100)
@@ -117,3 +139,19 @@ class TestGeneratePlaceholder:
         )
         img = Image.open(out)
         assert img.size == (200, 200)
+
+    def test_concurrent_writes_to_same_path(self, tmp_path: Path):
+        """Threads rendering the same placeholder at once must not collide."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        out = tmp_path / "shared.png"
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(generate_placeholder, shot_id="s1", width=320,
+                            height=180, output_path=out)
+                for _ in range(8)
+            ]
+            for f in futures:
+                assert f.result() == out
+        assert Image.open(out).size == (320, 180)
+        assert not list(tmp_path.glob(".*.tmp"))
@@ -40,15 +40,22 @@ class TestDryRun:
 
     _ASSET_MANIFEST_REF = "file:///asset_manifest.json"
 
-    @pytest.fixture()
-    def dry_result(self, tmp_path):
-        return PreviewRenderer(
+    @pytest.fixture(scope="class")
+    def dry_render(self, tmp_path_factory):
+        """One dry-run render shared by the class: (RenderOutput, output_dir)."""
+        out = tmp_path_factory.mktemp("dry_run") / "out"
+        result = PreviewRenderer(
             _make_manifest(),
             _make_plan(),
-            output_dir=tmp_path / "out",
+            output_dir=out,
             asset_manifest_ref=self._ASSET_MANIFEST_REF,
             dry_run=True,
         ).render()
+        return result, out
+
+    @pytest.fixture(scope="class")
+    def dry_result(self, dry_render):
+        return dry_render[0]
 
     def test_render_plan_ref(self, dry_result):
         assert dry_result.render_plan_ref == "file:///render_plan.json"
@@ -66,14 +73,8 @@ class TestDryRun:
         assert dry_result.effective_settings is not None
         assert dry_result.effective_settings.encoder == "libx264"
 
-    def test_only_json_written(self, tmp_path):
-        out = tmp_path / "out2"
-        PreviewRenderer(
-            _make_manifest(), _make_plan(),
-            output_dir=out,
-            asset_manifest_ref=self._ASSET_MANIFEST_REF,
-            dry_run=True,
-        ).render()
+    def test_only_json_written(self, dry_render):
+        _, out = dry_render
         assert {f.name for f in out.iterdir()} == {"render_output.json"}
 
     def test_inputs_digest_is_hex(self, dry_result):
@@ -365,3 +366,71 @@ class TestHighProfile:
         assert es.crf == "18"
         assert es.preset == "slow"
         assert es.profile == "high"
+
+
+class TestHardwareEncoder:
+    """RENDER_ALLOW_HW opt-in: detection and the libx264 guarantees."""
+
+    _ENCODERS_OUTPUT = (
+        "Encoders:\n"
+        " V..... = Video\n"
+        " ------\n"
+        " V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC\n"
+        " V....D h264_nvenc           NVIDIA NVENC H.264 encoder\n"
+    )
+
+    @pytest.fixture()
+    def detect(self, monkeypatch):
+        import subprocess
+        from renderer import ffmpeg_runner
+
+        def fake_run(*args, **kwargs):
+            return subprocess.CompletedProcess(args, 0, self._ENCODERS_OUTPUT, "")
+
+        monkeypatch.setattr(ffmpeg_runner.subprocess, "run", fake_run)
+        ffmpeg_runner.detect_hw_encoder.cache_clear()
+        yield ffmpeg_runner.detect_hw_encoder
+        ffmpeg_runner.detect_hw_encoder.cache_clear()
+
+    def test_detects_listed_encoder(self, detect):
+        assert detect() == "h264_nvenc"
+
+    def test_verify_restores_hw_encoder(self, detect, monkeypatch, tmp_path):
+        """verify() renders with libx264 without dropping the opted-in encoder."""
+        from renderer import preview_local
+
+        monkeypatch.setenv("RENDER_ALLOW_HW", "1")
+        monkeypatch.setattr(preview_local, "validate_ffmpeg", lambda: "6.1")
+        monkeypatch.setattr(preview_local, "detect_hw_encoder", detect)
+        renderer = PreviewRenderer(
+            _make_manifest(), _make_plan(),
+            output_dir=tmp_path / "out",
+            asset_manifest_ref="file:///asset_manifest.json",
+            dry_run=False,
+        )
+        assert renderer._encoder == "h264_nvenc"
+
+        seen = []
+
+        def fake_render():
+            seen.append(renderer._encoder)
+            raise RuntimeError("stop after encoder selection")
+
+        monkeypatch.setattr(renderer, "render", fake_render)
+        with pytest.raises(RuntimeError):
+            renderer.verify()
+
+        assert seen == ["libx264"]
+        assert renderer._encoder == "h264_nvenc"
+
+    def test_dry_run_ignores_env_and_keeps_libx264(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("RENDER_ALLOW_HW", "1")
+        result = PreviewRenderer(
+            _make_manifest(), _make_plan(),
+            output_dir=tmp_path / "out",
+            asset_manifest_ref="file:///asset_manifest.json",
+            dry_run=True,
+        ).render()
+        es = result.effective_settings
+        assert es.encoder == "libx264"
+        assert es.crf == "28"
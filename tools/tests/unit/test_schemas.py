@@ -31,23 +31,56 @@ from schemas.render_plan import FallbackConfig, RenderPlan, Resolution
 from schemas.render_output import Lineage, OutputHashes, Producer, Provenance, RenderFingerprint, RenderOutput
 
 
+# Shared read-only models: built (and validated) once per module.  Tests that
+# need a variant use model_copy(update=...) rather than rebuilding.
+
+@pytest.fixture(scope="module")
+def base_manifest() -> AssetManifest:
+    """Minimal valid AssetManifest (manifest_id="m-001")."""
+    return AssetManifest(
+        manifest_id="m-001",
+        project_id="proj-1",
+        shotlist_ref="file:///shotlist.json",
+        timing_lock_hash="sha256:abc",
+        shots=[Shot(shot_id="s1", duration_ms=2000)],
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_render_output() -> RenderOutput:
+    return RenderOutput(
+        output_id="out-001",
+        request_id="req-001",
+        render_plan_ref="file:///plan.json",
+        video_uri="file:///output.mp4",
+        captions_uri="file:///output.srt",
+        hashes=OutputHashes(
+            video_sha256="a" * 64,
+            captions_sha256="b" * 64,
+        ),
+        provenance=Provenance(
+            render_profile="preview_local",
+            timing_lock_hash="sha256:xyz",
+            rendered_at="2026-02-19T12:00:00Z",
+            ffmpeg_version="6.1.1",
+            placeholder_count=1,
+        ),
+        lineage=Lineage(
+            asset_manifest_hash="c" * 64,
+            render_plan_hash="d" * 64,
+        ),
+    )
+
+
 # ===========================================================================
 # AssetManifest — §5.7
 # ===========================================================================
 
 class TestAssetManifest:
 
-    def test_minimal_valid(self):
+    def test_minimal_valid(self, base_manifest):
         """AssetManifest with minimum required fields is accepted."""
-        m = AssetManifest(
-            manifest_id="m-001",
-            project_id="proj-1",
-            shotlist_ref="file:///shotlist.json",
-            timing_lock_hash="sha256:abc",
-            shots=[
-                Shot(shot_id="s1", duration_ms=2000),
-            ],
-        )
+        m = base_manifest
         assert m.schema_version == "1.0.0"
         assert len(m.shots) == 1
         assert m.music_uri is None
@@ -79,27 +112,18 @@ class TestAssetManifest:
         m2 = AssetManifest.model_validate_json(raw)
         assert m2 == m
 
-    def test_missing_manifest_id_raises(self):
-        with pytest.raises(ValidationError):
-            AssetManifest(  # type: ignore[call-arg]
-                project_id="p",
-                shotlist_ref="file:///sl.json",
-                timing_lock_hash="sha256:x",
-                shots=[],
-            )
-
-    def test_missing_timing_lock_hash_raises(self):
+    @pytest.mark.parametrize("model, kwargs", [
+        pytest.param(AssetManifest, {"project_id": "p", "shotlist_ref": "file:///sl.json",
+                                     "timing_lock_hash": "sha256:x", "shots": []},
+                     id="manifest_id"),
+        pytest.param(AssetManifest, {"manifest_id": "m", "project_id": "p",
+                                     "shotlist_ref": "file:///sl.json", "shots": []},
+                     id="timing_lock_hash"),
+        pytest.param(Shot, {"shot_id": "s1"}, id="shot_duration_ms"),
+    ])
+    def test_missing_required_raises(self, model, kwargs):
         with pytest.raises(ValidationError):
-            AssetManifest(  # type: ignore[call-arg]
-                manifest_id="m",
-                project_id="p",
-                shotlist_ref="file:///sl.json",
-                shots=[],
-            )
-
-    def test_shot_duration_ms_required(self):
-        with pytest.raises(ValidationError):
-            Shot(shot_id="s1")  # type: ignore[call-arg]
+            model(**kwargs)
 
     def test_visual_asset_null_uri_accepted(self):
         """asset_uri=None is valid (means placeholder needed)."""
@@ -115,20 +139,10 @@ class TestAssetManifest:
 
     def test_vo_line_field_names(self):
         """Canonical field names from §5.7 are present."""
-        v = VOLine(
-            line_id="v1",
-            speaker_id="hero",
-            text="words",
-            emotion="calm",
-            pacing_tags=["slow"],
-            audio_uri="file:///v.wav",
-            timeline_in_ms=100,
-            timeline_out_ms=900,
-        )
-        d = v.model_dump()
-        assert "speaker_id" in d
-        assert "pacing_tags" in d
-        assert "emotion" in d
+        fields = VOLine.model_fields
+        assert "speaker_id" in fields
+        assert "pacing_tags" in fields
+        assert "emotion" in fields
 
     def test_sfx_item(self):
         sfx = SFXItem(sfx_id="s1", description="thunder", timeline_in_ms=500)
@@ -165,13 +179,17 @@ class TestRenderPlan:
         rp2 = RenderPlan.model_validate_json(rp.model_dump_json())
         assert rp2 == rp
 
-    def test_missing_timing_lock_hash_raises(self):
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"plan_id": "p", "project_id": "p",
+                      "asset_manifest_ref": "file:///m.json"},
+                     id="timing_lock_hash"),
+        pytest.param({"project_id": "p", "asset_manifest_ref": "file:///m.json",
+                      "timing_lock_hash": "sha256:x"},
+                     id="plan_id"),
+    ])
+    def test_missing_required_raises(self, kwargs):
         with pytest.raises(ValidationError):
-            RenderPlan(  # type: ignore[call-arg]
-                plan_id="p",
-                project_id="p",
-                asset_manifest_ref="file:///m.json",
-            )
+            RenderPlan(**kwargs)
 
     def test_resolution_defaults(self):
         r = Resolution()
@@ -195,17 +213,11 @@ class TestRenderPlan:
         assert rp.asset_resolutions["id1"] == "file:///a.png"
 
     def test_canonical_field_names(self):
-        """§5.8 canonical field names are present in serialised output."""
-        rp = RenderPlan(
-            plan_id="x",
-            project_id="p",
-            asset_manifest_ref="file:///m.json",
-            timing_lock_hash="sha256:x",
-        )
-        d = rp.model_dump()
+        """§5.8 canonical field names are declared on the model."""
+        fields = RenderPlan.model_fields
         for field in ("profile", "resolution", "fps", "timing_lock_hash",
                       "asset_manifest_ref", "asset_resolutions"):
-            assert field in d, f"Missing canonical field: {field}"
+            assert field in fields, f"Missing canonical field: {field}"
 
 
 # ===========================================================================
@@ -214,49 +226,25 @@ class TestRenderPlan:
 
 class TestRenderOutput:
 
-    def _make_valid(self) -> RenderOutput:
-        return RenderOutput(
-            output_id="out-001",
-            request_id="req-001",
-            render_plan_ref="file:///plan.json",
-            video_uri="file:///output.mp4",
-            captions_uri="file:///output.srt",
-            hashes=OutputHashes(
-                video_sha256="a" * 64,
-                captions_sha256="b" * 64,
-            ),
-            provenance=Provenance(
-                render_profile="preview_local",
-                timing_lock_hash="sha256:xyz",
-                rendered_at="2026-02-19T12:00:00Z",
-                ffmpeg_version="6.1.1",
-                placeholder_count=1,
-            ),
-            lineage=Lineage(
-                asset_manifest_hash="c" * 64,
-                render_plan_hash="d" * 64,
-            ),
-        )
-
-    def test_valid(self):
-        ro = self._make_valid()
+    def test_valid(self, valid_render_output):
+        ro = valid_render_output
         assert ro.schema_version == "0.0.1"
         assert ro.schema_id == "RenderOutput"
         assert ro.producer.name == "PreviewRenderer"
         assert ro.producer.version == "0.0.1"
         assert ro.audio_stems_uri is None
 
-    def test_producer_defaults(self):
-        ro = self._make_valid()
+    def test_producer_defaults(self, valid_render_output):
+        ro = valid_render_output
         assert ro.producer.name == "PreviewRenderer"
         assert ro.producer.version == "0.0.1"
 
-    def test_schema_id_default(self):
-        ro = self._make_valid()
+    def test_schema_id_default(self, valid_render_output):
+        ro = valid_render_output
         assert ro.schema_id == "RenderOutput"
 
-    def test_roundtrip_json(self):
-        ro = self._make_valid()
+    def test_roundtrip_json(self, valid_render_output):
+        ro = valid_render_output
         ro2 = RenderOutput.model_validate_json(ro.model_dump_json())
         assert ro2 == ro
 
@@ -282,16 +270,15 @@ class TestRenderOutput:
         assert ro.video_uri is None
 
     def test_canonical_field_names(self):
-        """§5.9 canonical field names are present."""
-        ro = self._make_valid()
-        d = ro.model_dump()
+        """§5.9 canonical field names are declared on the model."""
+        fields = RenderOutput.model_fields
         for field in ("video_uri", "captions_uri", "audio_stems_uri",
                       "hashes", "provenance", "lineage"):
-            assert field in d, f"Missing canonical field: {field}"
+            assert field in fields, f"Missing canonical field: {field}"
 
-    def test_audio_stems_optional(self):
+    def test_audio_stems_optional(self, valid_render_output):
         """audio_stems_uri is optional (null in Phase 0)."""
-        ro = self._make_valid()
+        ro = valid_render_output
         assert ro.audio_stems_uri is None
         # Also accept explicit null in JSON
         j = json.loads(ro.model_dump_json())
@@ -310,21 +297,12 @@ class TestCanonicalJsonHash:
     every call, regardless of Python dict insertion order or Pydantic version.
     """
 
-    def _manifest(self, manifest_id: str = "m-001") -> AssetManifest:
-        return AssetManifest(
-            manifest_id=manifest_id,
-            project_id="proj-1",
-            shotlist_ref="file:///shotlist.json",
-            timing_lock_hash="sha256:abc",
-            shots=[Shot(shot_id="s1", duration_ms=2000)],
-        )
-
-    def test_same_object_same_hash_repeated(self):
+    def test_same_object_same_hash_repeated(self, base_manifest):
         """The same AssetManifest always produces the same canonical hash."""
         from renderer.preview_local import _canonical_json_hash
 
-        m = self._manifest()
-        hashes = [_canonical_json_hash(m.model_dump()) for _ in range(5)]
+        dumped = base_manifest.model_dump()
+        hashes = [_canonical_json_hash(dumped) for _ in range(5)]
         assert len(set(hashes)) == 1, (
             f"_canonical_json_hash is not stable: got {set(hashes)}"
         )
@@ -339,31 +317,40 @@ class TestCanonicalJsonHash:
             asset_manifest_ref="file:///manifest.json",
             timing_lock_hash="sha256:abc",
         )
-        hashes = [_canonical_json_hash(rp.model_dump()) for _ in range(5)]
+        dumped = rp.model_dump()
+        hashes = [_canonical_json_hash(dumped) for _ in range(5)]
         assert len(set(hashes)) == 1, (
             f"_canonical_json_hash is not stable: got {set(hashes)}"
         )
 
-    def test_distinct_objects_distinct_hashes(self):
+    def test_model_dump_produces_equal_dicts(self, base_manifest):
+        """Repeated model_dump() calls yield equal dicts (the hash input is stable)."""
+        assert base_manifest.model_dump() == base_manifest.model_dump()
+
+    def test_distinct_objects_distinct_hashes(self, base_manifest):
         """Two manifests that differ in any field must produce different hashes."""
         from renderer.preview_local import _canonical_json_hash
 
-        h1 = _canonical_json_hash(self._manifest("m-aaa").model_dump())
-        h2 = _canonical_json_hash(self._manifest("m-bbb").model_dump())
+        m_aaa = base_manifest.model_copy(update={"manifest_id": "m-aaa"})
+        m_bbb = base_manifest.model_copy(update={"manifest_id": "m-bbb"})
+        h1 = _canonical_json_hash(m_aaa.model_dump())
+        h2 = _canonical_json_hash(m_bbb.model_dump())
         assert h1 != h2
 
-    def test_canonical_json_is_sorted_keys(self):
+    def test_canonical_json_is_sorted_keys(self, base_manifest):
         """canonical JSON must have sorted keys (contract for cross-language interop)."""
+        import hashlib
+
+        from renderer._hashing import canonical_json_bytes
         from renderer.preview_local import _canonical_json_hash
 
-        # Build the canonical string directly and check key order.
-        m = self._manifest()
-        d = m.model_dump()
-        canonical = json.dumps(d, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-        parsed_keys = list(json.loads(canonical).keys())
-        assert parsed_keys == sorted(parsed_keys), (
-            "Top-level keys are not sorted in canonical JSON output."
+        # Keys sorted at every level, compact separators — checked on the bytes.
+        assert canonical_json_bytes({"b": 1, "a": {"d": 2, "c": 3}}) == (
+            b'{"a":{"c":3,"d":2},"b":1}'
         )
+        # ...and those bytes are exactly what _canonical_json_hash digests.
+        d = base_manifest.model_dump()
+        assert _canonical_json_hash(d) == hashlib.sha256(canonical_json_bytes(d)).hexdigest()
 
 
 # ===========================================================================
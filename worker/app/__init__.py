@@ -9,13 +9,9 @@ RQ-based worker for processing background jobs including:
 - Media processing (metadata extraction, thumbnail generation)
 """
 
+from . import queues as _queues
 from .queues import (
     get_redis_connection,
-    preview_queue,
-    beat_queue,
-    timeline_queue,
-    final_queue,
-    thumbnail_queue,
     ALL_QUEUES,
 )
 
@@ -48,3 +44,11 @@ __all__ = [
     "MEDIA_PROCESSING_TIMEOUT",
     "BEAT_ANALYSIS_TIMEOUT",
 ]
+
+
+def __getattr__(name: str):
+    # Queue instances (preview_queue, ...) are created on first access by
+    # app.queues; forward so importing the package does not build them.
+    if name in _queues._QUEUE_MAP:
+        return getattr(_queues, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,8 +9,8 @@ import os
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, scoped_session, sessionmaker, DeclarativeBase
 
 
 # Get database URL from environment (convert async URL to sync if needed)
@@ -32,15 +32,41 @@ def get_database_url() -> str:
 _engine = None
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Per-connection SQLite tuning: WAL journal, relaxed fsync, 64 MiB page cache."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
 def get_engine():
-    """Get or create the sync database engine."""
+    """
+    Get or create the sync database engine.
+
+    SQLite (local/dev) gets WAL + cache pragmas on every connection.
+    Otherwise the pool holds a single connection: an RQ worker runs one job
+    at a time and each task opens exactly one session.
+    """
     global _engine
     if _engine is None:
         database_url = get_database_url()
-        _engine = create_engine(
-            database_url,
-            echo=os.environ.get("SQL_ECHO", "false").lower() == "true",
-        )
+        echo = os.environ.get("SQL_ECHO", "false").lower() == "true"
+        if database_url.startswith("sqlite"):
+            _engine = create_engine(
+                database_url,
+                echo=echo,
+                connect_args={"check_same_thread": False},
+            )
+            event.listen(_engine, "connect", _set_sqlite_pragmas)
+        else:
+            _engine = create_engine(
+                database_url,
+                echo=echo,
+                pool_size=1,
+                max_overflow=0,
+            )
     return _engine
 
 
@@ -48,15 +74,20 @@ def get_engine():
 _SessionLocal = None
 
 
-def get_session_factory():
-    """Get or create the session factory."""
+def get_session_factory() -> scoped_session:
+    """
+    Get or create the thread-scoped session registry.
+
+    Calling the registry returns the current thread's Session, creating it
+    on first use; ``remove()`` closes and discards it.
+    """
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(
+        _SessionLocal = scoped_session(sessionmaker(
             bind=get_engine(),
             autocommit=False,
             autoflush=False,
-        )
+        ))
     return _SessionLocal
 
 
@@ -70,8 +101,18 @@ def get_db_session() -> Generator[Session, None, None]:
             audio = db.query(AudioTrack).filter_by(id=audio_id).first()
             audio.analysis_status = "processing"
             db.commit()
+
+    Not reentrant: the session is the thread's scoped session, so a nested
+    get_db_session() would hand back the same session and its commit or
+    rollback would act on the outer unit of work.  Nesting raises
+    RuntimeError instead; pass the outer session down.
     """
     SessionLocal = get_session_factory()
+    if SessionLocal.registry.has():
+        raise RuntimeError(
+            "get_db_session() is already active on this thread; "
+            "reuse the outer session instead of nesting"
+        )
     session = SessionLocal()
     try:
         yield session
@@ -79,7 +120,7 @@ def get_db_session() -> Generator[Session, None, None]:
         session.rollback()
         raise
     finally:
-        session.close()
+        SessionLocal.remove()
 
 
 # Base class for models (for type hints only - actual models come from backend)
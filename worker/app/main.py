@@ -12,24 +12,62 @@ Usage:
 
 Environment Variables:
     REDIS_URL: Redis connection URL (default: redis://localhost:6379/0)
+    REDIS_STARTUP_PING: Set to "true" to PING Redis before starting the worker
 """
 
+import gc
+import importlib
 import logging
+import os
 import sys
 from redis import Redis
 from rq import Queue, Worker
 
 from .queues import get_redis_connection, ALL_QUEUES
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+# Configure logging: a single stdout handler on the root logger.  Task
+# modules log through their own module loggers and propagate to it.
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter(
+    "{asctime} - {name} - {levelname} - {message}", style="{",
+))
+logging.root.addHandler(_log_handler)
+logging.root.setLevel(logging.INFO)
+# The format uses no thread / process fields: skip collecting them per record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger("beatstitch.worker")
 
 
+# Heavy optional libraries the tasks import lazily (inside functions).  RQ
+# forks a fresh work horse per job, so anything not imported in this parent
+# process is re-imported by every job.  Loading them once before work()
+# lets each fork inherit them already initialised.
+_PRELOAD_MODULES = (
+    "madmom",
+    "librosa",
+)
+
+
+def preload_task_dependencies() -> None:
+    """Import the lazily-loaded task dependencies that are installed."""
+    for module_name in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            logger.info(f"Optional dependency not installed: {module_name}")
+
+    # Build the shared beat detector (and its madmom models) here so forked
+    # jobs inherit it.
+    from .tasks.beat_analysis import get_beat_detector
+
+    try:
+        get_beat_detector().warm_up()
+    except Exception as e:
+        logger.warning(f"Beat detector warm-up failed, jobs will retry: {e}")
+
+
 def create_worker(connection: Redis) -> Worker:
     """
     Create an RQ worker that listens to all BeatStitch queues.
@@ -69,9 +107,11 @@ def start_worker() -> None:
     try:
         connection = get_redis_connection()
 
-        # Verify Redis connection
-        connection.ping()
-        logger.info("Successfully connected to Redis")
+        # The first RQ command in worker.work() fails fast on a bad
+        # connection, so the explicit round trip is opt-in.
+        if os.environ.get("REDIS_STARTUP_PING", "false").lower() == "true":
+            connection.ping()
+            logger.info("Successfully connected to Redis")
 
     except Exception as e:
         logger.error(f"Failed to connect to Redis: {e}")
@@ -79,6 +119,11 @@ def start_worker() -> None:
 
     logger.info(f"Listening on queues: {', '.join(ALL_QUEUES)}")
 
+    preload_task_dependencies()
+    # Move everything loaded so far (madmom models included) to the GC's
+    # permanent generation: collections in a forked work horse then never
+    # write to those objects, so their pages stay shared with this process.
+    gc.freeze()
     worker = create_worker(connection)
 
     try:
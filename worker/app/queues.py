@@ -10,31 +10,60 @@ Defines 5 queues in priority order:
 """
 
 import os
+import socket
+from functools import lru_cache
 from redis import Redis
 from rq import Queue
 from typing import Optional
 
-# Redis connection singleton
-_redis_connection: Optional[Redis] = None
+
+# TCP keepalive probes (idle 30s, every 10s, 3 failures) so a dead Redis
+# connection is detected by the socket itself.  Linux names; skipped elsewhere.
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, opt): value
+    for opt, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, opt)
+}
 
 
+@lru_cache(maxsize=1)
 def get_redis_connection() -> Redis:
     """
     Get or create a Redis connection from environment variable REDIS_URL.
 
+    The connection is created once per process and memoized; call
+    ``get_redis_connection.cache_clear()`` to force a new one.  TCP keepalive
+    and a 30s health check let redis-py validate idle connections itself.
+
     Returns:
         Redis: A Redis connection instance
-
-    Raises:
-        ValueError: If REDIS_URL environment variable is not set
     """
-    global _redis_connection
+    redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    return Redis.from_url(
+        redis_url,
+        decode_responses=False,
+        socket_keepalive=True,
+        socket_keepalive_options=_KEEPALIVE_OPTIONS,
+        health_check_interval=30,
+    )
+
+
+# Queues in priority order (highest first): (short name, Redis queue name).
+# ALL_QUEUES, QUEUE_NAMES and the lazy module attributes are all derived from
+# this one table, so their order and names cannot drift apart.
+_QUEUES: tuple[tuple[str, str], ...] = (
+    ("render_preview", "beatstitch:render_preview"),   # High priority
+    ("beat_analysis", "beatstitch:beat_analysis"),     # Medium priority
+    ("timeline", "beatstitch:timeline"),               # Medium priority
+    ("render_final", "beatstitch:render_final"),       # Low priority
+    ("thumbnails", "beatstitch:thumbnails"),           # Low priority
+)
 
-    if _redis_connection is None:
-        redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
-        _redis_connection = Redis.from_url(redis_url, decode_responses=False)
+# All queues in priority order for worker initialization
+ALL_QUEUES: tuple[str, ...] = tuple(name for _, name in _QUEUES)
 
-    return _redis_connection
+# Queue name constants for use in enqueue functions
+QUEUE_NAMES: dict[str, str] = dict(_QUEUES)
 
 
 def create_queues(connection: Optional[Redis] = None) -> tuple:
@@ -51,60 +80,24 @@ def create_queues(connection: Optional[Redis] = None) -> tuple:
     if connection is None:
         connection = get_redis_connection()
 
-    preview = Queue("beatstitch:render_preview", connection=connection)
-    beat = Queue("beatstitch:beat_analysis", connection=connection)
-    timeline = Queue("beatstitch:timeline", connection=connection)
-    final = Queue("beatstitch:render_final", connection=connection)
-    thumbnail = Queue("beatstitch:thumbnails", connection=connection)
-
-    return preview, beat, timeline, final, thumbnail
-
-
-# Queue instances - created lazily when first accessed
-# These are module-level for convenience but use lazy initialization
-class _LazyQueue:
-    """Lazy queue wrapper that initializes on first access."""
+    return tuple(Queue(name, connection=connection) for name in ALL_QUEUES)
 
-    def __init__(self, name: str):
-        self._name = name
-        self._queue: Optional[Queue] = None
 
-    def _get_queue(self) -> Queue:
-        if self._queue is None:
-            self._queue = Queue(self._name, connection=get_redis_connection())
-        return self._queue
-
-    def __getattr__(self, name):
-        return getattr(self._get_queue(), name)
-
-    def enqueue(self, *args, **kwargs):
-        return self._get_queue().enqueue(*args, **kwargs)
-
-    def enqueue_call(self, *args, **kwargs):
-        return self._get_queue().enqueue_call(*args, **kwargs)
-
-
-# Queue instances in priority order (highest first)
-preview_queue = _LazyQueue("beatstitch:render_preview")
-beat_queue = _LazyQueue("beatstitch:beat_analysis")
-timeline_queue = _LazyQueue("beatstitch:timeline")
-final_queue = _LazyQueue("beatstitch:render_final")
-thumbnail_queue = _LazyQueue("beatstitch:thumbnails")
+# Module attribute -> short queue name.  The Queue instances are created
+# lazily on first access via the module-level __getattr__ below (PEP 562) and
+# then stored in the module globals, so later accesses are plain lookups.
+_QUEUE_MAP = {
+    "preview_queue": "render_preview",
+    "beat_queue": "beat_analysis",
+    "timeline_queue": "timeline",
+    "final_queue": "render_final",
+    "thumbnail_queue": "thumbnails",
+}
 
-# All queues in priority order for worker initialization
-ALL_QUEUES = [
-    "beatstitch:render_preview",   # High priority
-    "beatstitch:beat_analysis",    # Medium priority
-    "beatstitch:timeline",         # Medium priority
-    "beatstitch:render_final",     # Low priority
-    "beatstitch:thumbnails",       # Low priority
-]
 
-# Queue name constants for use in enqueue functions
-QUEUE_NAMES = {
-    "render_preview": "beatstitch:render_preview",
-    "beat_analysis": "beatstitch:beat_analysis",
-    "timeline": "beatstitch:timeline",
-    "render_final": "beatstitch:render_final",
-    "thumbnails": "beatstitch:thumbnails",
-}
+def __getattr__(name: str) -> Queue:
+    if name in _QUEUE_MAP:
+        queue = Queue(QUEUE_NAMES[_QUEUE_MAP[name]], connection=get_redis_connection())
+        globals()[name] = queue
+        return queue
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,17 +12,25 @@ Job timeout: 5 minutes
 """
 
 import hashlib
-import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import orjson
+from redis.exceptions import RedisError
 from rq import get_current_job
+from sqlalchemy import BigInteger, Column, DateTime, Float, Integer, String, update
+from sqlalchemy.orm import declarative_base
 
 from ..db import get_db_session
+from ..queues import get_redis_connection
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +40,69 @@ STORAGE_ROOT = Path(os.environ.get("STORAGE_PATH", "/data"))
 # Job timeout for beat analysis (5 minutes)
 BEAT_ANALYSIS_TIMEOUT = 300
 
+# Networks of madmom's 8-model beat ensemble to evaluate.  Inference cost is
+# linear in this; 4 models keep beat times close to the full ensemble.
+MADMOM_NUM_MODELS = int(os.environ.get("MADMOM_NUM_MODELS", 4))
+
+# librosa fallback: analyze at 11.025 kHz (half the FFT work of 22.05 kHz)
+# with a 256-sample hop, keeping the ~23 ms frame resolution of the old
+# 22.05 kHz / 512 setup.
+LIBROSA_SAMPLE_RATE = 11025
+LIBROSA_HOP_LENGTH = 256
+
+# MADMOM_DBN_ONLINE=true decodes beats with the DBN's forward-only online
+# mode instead of the full Viterbi pass: much faster on long tracks, at some
+# cost in beat-time accuracy (it cannot revise earlier beats).
+MADMOM_DBN_ONLINE = os.environ.get("MADMOM_DBN_ONLINE", "false").lower() == "true"
+
+# madmom configuration a beat grid was produced with.  Only madmom results
+# matching the current settings are reused, so changing the model count or
+# DBN mode does not keep serving grids from the old setup.
+MADMOM_SETTINGS = (
+    f"models={MADMOM_NUM_MODELS},dbn={'online' if MADMOM_DBN_ONLINE else 'offline'}"
+)
+
+# Successful madmom beat grids are cached in Redis under
+# beatgrid:{MADMOM_SETTINGS}:{audio checksum} so re-analysis of the same audio
+# (retries, re-uploads) skips detection.  Fallback results (librosa, default
+# grids) are never cached: a retry should get another chance at madmom.
+BEAT_GRID_CACHE_PREFIX = "beatgrid:"
+BEAT_GRID_CACHE_TTL = 30 * 86400  # 30 days
+
+
+# ============================================================================
+# Local Model Definitions (to avoid circular imports)
+# ============================================================================
+
+Base = declarative_base()
+
+
+class AudioTrack(Base):
+    """Local model definition for AudioTrack (see backend/app/models/audio.py)."""
+
+    __tablename__ = "audio_tracks"
+
+    id = Column(String(36), primary_key=True)
+    project_id = Column(String(36), nullable=False)  # FK to projects.id
+    filename = Column(String(255), nullable=False)
+    original_filename = Column(String(255), nullable=False)
+    file_path = Column(String(500), nullable=False)
+    file_size = Column(BigInteger, nullable=False)
+    duration_ms = Column(Integer, nullable=False)
+    sample_rate = Column(Integer, nullable=True)
+    bpm = Column(Float, nullable=True)
+    beat_count = Column(Integer, nullable=True)
+    beat_grid_path = Column(String(500), nullable=True)
+    analysis_status = Column(String(20), default="pending", nullable=False)
+    analysis_error = Column(String(500), nullable=True)
+    analyzed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO-8601 with a Z suffix, to the second."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 @dataclass
 class Beat:
@@ -57,15 +128,83 @@ class BeatGrid:
     # Additional metadata
     version: str = "1.0"
     analyzer: str = "unknown"
-    analyzed_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    analyzed_at: str = field(default_factory=_utc_timestamp)
     audio_file_checksum: str = ""
     sample_rate: int = 44100
     duration_ms: int = 0
     bpm_confidence: float = 0.8
+    analyzer_settings: str = ""
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # beats is already a list of plain dicts; asdict() would deep-copy it.
+        return {
+            "bpm": self.bpm,
+            "total_beats": self.total_beats,
+            "time_signature": self.time_signature,
+            "beats": self.beats,
+            "version": self.version,
+            "analyzer": self.analyzer,
+            "analyzed_at": self.analyzed_at,
+            "audio_file_checksum": self.audio_file_checksum,
+            "sample_rate": self.sample_rate,
+            "duration_ms": self.duration_ms,
+            "bpm_confidence": self.bpm_confidence,
+            "analyzer_settings": self.analyzer_settings,
+        }
+
+
+def _build_beats(beat_times: Any) -> List[Dict[str, Any]]:
+    """Build the beat list for beat times in seconds (see _beats_from_ms)."""
+    times_ms = (np.asarray(beat_times, dtype=np.float64) * 1000).astype(np.int64)
+    return _beats_from_ms(times_ms)
+
+
+def _beats_from_ms(times_ms: Any) -> List[Dict[str, Any]]:
+    """
+    Build the beat list for an integer array of beat times in milliseconds,
+    numbering beats 1-4 cyclically (synthetic 4/4).
+
+    The per-beat arithmetic runs in numpy; tolist() hands back plain Python
+    ints so only the dict construction remains per beat.
+    """
+    beat_numbers = np.arange(len(times_ms)) % 4 + 1
+    return [
+        {"time_ms": t, "beat_number": b, "is_downbeat": b == 1}
+        for t, b in zip(times_ms.tolist(), beat_numbers.tolist())
+    ]
+
+
+def _is_reusable(beat_grid: BeatGrid) -> bool:
+    """True if beat_grid is a madmom result produced with the current settings."""
+    return beat_grid.analyzer == "madmom" and beat_grid.analyzer_settings == MADMOM_SETTINGS
+
+
+def _beat_grid_cache_key(checksum: str) -> str:
+    """Redis key for the cached madmom beat grid of the given audio checksum."""
+    return f"{BEAT_GRID_CACHE_PREFIX}{MADMOM_SETTINGS}:{checksum}"
+
+
+def _dump_beat_grid(beat_grid: BeatGrid) -> bytes:
+    """
+    Serialize a beat grid to compact JSON bytes (beats.json / Redis cache).
+
+    No indentation: the output is machine-read (API, motion engine) and
+    indenting roughly doubles its size.
+    """
+    return orjson.dumps(beat_grid.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+@lru_cache(maxsize=1)
+def _check_madmom() -> bool:
+    """Check if madmom is available (probed once per process)."""
+    try:
+        import madmom
+
+        return True
+    except ImportError:
+        logger.warning("madmom not available, will use librosa fallback")
+        return False
 
 
 class BeatDetector:
@@ -78,20 +217,40 @@ class BeatDetector:
     """
 
     def __init__(self) -> None:
-        self.madmom_available = self._check_madmom()
+        self.madmom_available = _check_madmom()
+        # madmom processors, built on first use (loading the RNN weights is
+        # the expensive part) and reused for every later analysis.
+        self._beat_proc = None
+        self._dbn_proc = None
+        self._tempo_proc = None
         logger.info(f"BeatDetector initialized. madmom available: {self.madmom_available}")
 
-    def _check_madmom(self) -> bool:
-        """Check if madmom is available."""
-        try:
+    def warm_up(self) -> None:
+        """Build the madmom processors now rather than in the first job."""
+        if self.madmom_available:
+            self._get_madmom_processors()
+
+    def _get_madmom_processors(self) -> tuple:
+        """Return (beat_proc, dbn_proc, tempo_proc), constructing them once."""
+        if self._beat_proc is None:
             import madmom
 
-            return True
-        except ImportError:
-            logger.warning("madmom not available, will use librosa fallback")
-            return False
+            # Deliberately no num_threads: madmom implements it with a
+            # multiprocessing.Pool that it creates eagerly and never exposes
+            # for shutdown.  Built before the RQ fork it hangs the work horse;
+            # built inside the horse it leaks its worker processes (each
+            # holding the RNN models), since the horse leaves via os._exit()
+            # and skips multiprocessing's finalizers.
+            self._beat_proc = madmom.features.beats.RNNBeatProcessor(
+                nn_files=madmom.models.BEATS_LSTM[:MADMOM_NUM_MODELS],
+            )
+            self._dbn_proc = madmom.features.beats.DBNBeatTrackingProcessor(
+                fps=100, online=MADMOM_DBN_ONLINE
+            )
+            self._tempo_proc = madmom.features.tempo.TempoEstimationProcessor(fps=100)
+        return self._beat_proc, self._dbn_proc, self._tempo_proc
 
-    def analyze(self, audio_path: str, output_path: str) -> BeatGrid:
+    def analyze(self, audio_path: str, output_path: str, force: bool = False) -> BeatGrid:
         """
         Analyze audio and return beat grid.
         Falls back to librosa if madmom fails or is unavailable.
@@ -99,6 +258,8 @@ class BeatDetector:
         Args:
             audio_path: Path to audio file
             output_path: Path to save beats.json
+            force: Skip the existing beats.json and the Redis cache and
+                always run detection (the cache is refreshed on success)
 
         Returns:
             BeatGrid object with detected beats
@@ -106,6 +267,19 @@ class BeatDetector:
         # Compute checksum for cache validation
         audio_checksum = self._compute_checksum(audio_path)
 
+        if not force:
+            # beats.json from an earlier run on the same audio is still valid
+            beat_grid = self._load_existing_beat_grid(output_path, audio_checksum)
+            if beat_grid is not None:
+                logger.info(f"Reusing beat grid at {output_path} ({audio_checksum})")
+                return beat_grid
+
+            beat_grid = self._load_cached_beat_grid(audio_checksum)
+            if beat_grid is not None:
+                logger.info(f"Beat grid cache hit for {audio_checksum}")
+                self._save_beat_grid(beat_grid, output_path)
+                return beat_grid
+
         try:
             if self.madmom_available:
                 beat_grid = self._analyze_with_madmom(audio_path, audio_checksum)
@@ -117,16 +291,73 @@ class BeatDetector:
 
         # Persist to filesystem (authoritative storage)
         self._save_beat_grid(beat_grid, output_path)
+        if _is_reusable(beat_grid):
+            self._cache_beat_grid(beat_grid)
 
         return beat_grid
 
+    def _load_existing_beat_grid(
+        self, output_path: str, checksum: str
+    ) -> Optional[BeatGrid]:
+        """
+        Return the beat grid at output_path if madmom computed it from this
+        audio with the current settings.
+        """
+        try:
+            with open(output_path, "rb") as f:
+                data = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if data.get("audio_file_checksum") != checksum:
+            return None
+        try:
+            beat_grid = BeatGrid(**data)
+        except TypeError:
+            return None
+        return beat_grid if _is_reusable(beat_grid) else None
+
+    def _load_cached_beat_grid(self, checksum: str) -> Optional[BeatGrid]:
+        """Look up a previously analyzed beat grid in Redis (best effort)."""
+        try:
+            cached = get_redis_connection().get(_beat_grid_cache_key(checksum))
+        except RedisError as e:
+            logger.warning(f"Beat grid cache lookup failed: {e}")
+            return None
+        if cached is None:
+            return None
+        try:
+            return BeatGrid(**orjson.loads(cached))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cached beat grid for {checksum}: {e}")
+            return None
+
+    def _cache_beat_grid(self, beat_grid: BeatGrid) -> None:
+        """Store a madmom beat grid in Redis keyed by its audio checksum (best effort)."""
+        key = _beat_grid_cache_key(beat_grid.audio_file_checksum)
+        try:
+            get_redis_connection().setex(
+                key, BEAT_GRID_CACHE_TTL, _dump_beat_grid(beat_grid)
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to cache beat grid: {e}")
+
     def _compute_checksum(self, file_path: str) -> str:
         """Compute SHA-256 checksum of audio file."""
-        sha256 = hashlib.sha256()
+        # file_digest (3.11+) hashes in C straight from the file, without a
+        # Python-level read loop.
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return f"sha256:{sha256.hexdigest()}"
+            return f"sha256:{hashlib.file_digest(f, 'sha256').hexdigest()}"
+
+    @staticmethod
+    def _load_signal(audio_path: str) -> Any:
+        """Decode audio into a mono 44.1 kHz madmom Signal."""
+        import madmom
+
+        # Keep the decoder's native int16 samples: the whole track stays
+        # resident for the duration of the analysis, and madmom's STFT
+        # scales its window for integer signals, so float32 would only
+        # double RSS.
+        return madmom.audio.signal.Signal(audio_path, sample_rate=44100, num_channels=1)
 
     def _analyze_with_madmom(self, audio_path: str, checksum: str) -> BeatGrid:
         """
@@ -134,19 +365,18 @@ class BeatDetector:
         Only uses RNNBeatProcessor + DBNBeatTrackingProcessor for beat times.
         Does NOT use downbeat detection (fragile pipeline).
         """
-        import madmom
-
         logger.info(f"Analyzing with madmom: {audio_path}")
 
-        # Load audio signal
-        sig = madmom.audio.signal.Signal(audio_path, sample_rate=44100, num_channels=1)
+        # Decode once; the beat RNN consumes this signal and the tempo
+        # estimator reuses its activations.
+        sig = self._load_signal(audio_path)
         duration_ms = int(len(sig) / 44100 * 1000)
 
+        beat_proc, dbn_proc, tempo_proc = self._get_madmom_processors()
+
         # Beat tracking with neural network
-        beat_proc = madmom.features.beats.RNNBeatProcessor()
         beat_act = beat_proc(sig)
 
-        dbn_proc = madmom.features.beats.DBNBeatTrackingProcessor(fps=100)
         beat_times = dbn_proc(beat_act)  # Returns array of beat times in seconds
 
         # Handle edge case: no beats detected
@@ -156,7 +386,6 @@ class BeatDetector:
 
         # Tempo estimation
         try:
-            tempo_proc = madmom.features.tempo.TempoEstimationProcessor(fps=100)
             tempo_result = tempo_proc(beat_act)
             bpm = float(tempo_result[0][0])
             bpm_confidence = float(tempo_result[0][1]) if len(tempo_result[0]) > 1 else 0.8
@@ -164,27 +393,19 @@ class BeatDetector:
             logger.warning(f"Tempo estimation failed: {e}, calculating from beat intervals")
             # Calculate BPM from beat intervals
             if len(beat_times) >= 2:
-                intervals = [beat_times[i + 1] - beat_times[i] for i in range(len(beat_times) - 1)]
-                avg_interval = sum(intervals) / len(intervals)
+                avg_interval = float(np.diff(beat_times).mean())
                 bpm = 60.0 / avg_interval if avg_interval > 0 else 120.0
             else:
                 bpm = 120.0
             bpm_confidence = 0.6
 
         # Build beat list with synthetic 4/4 beat numbers (no downbeat detection)
-        beats = []
-        for i, time_sec in enumerate(beat_times):
-            beat_number = (i % 4) + 1  # Cycle 1, 2, 3, 4
-            beats.append({
-                "time_ms": int(time_sec * 1000),
-                "beat_number": beat_number,
-                "is_downbeat": beat_number == 1,
-            })
+        beats = _build_beats(beat_times)
 
         return BeatGrid(
             version="1.0",
             analyzer="madmom",
-            analyzed_at=datetime.utcnow().isoformat() + "Z",
+            analyzer_settings=MADMOM_SETTINGS,
             audio_file_checksum=checksum,
             sample_rate=44100,
             duration_ms=duration_ms,
@@ -201,7 +422,7 @@ class BeatDetector:
 
         logger.info(f"Analyzing with librosa: {audio_path}")
 
-        y, sr = librosa.load(audio_path, sr=22050)
+        y, sr = librosa.load(audio_path, sr=LIBROSA_SAMPLE_RATE, mono=True)
         duration_ms = int(len(y) / sr * 1000)
 
         # Handle edge case: very short audio
@@ -209,8 +430,13 @@ class BeatDetector:
             logger.warning("Audio too short for beat detection, generating default beat grid")
             return self._generate_default_beat_grid(duration_ms, checksum, "librosa")
 
-        tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
-        beat_times = librosa.frames_to_time(beat_frames, sr=sr)
+        # Compute the onset envelope once and hand it to beat_track, which
+        # would otherwise derive it from y itself.
+        onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=LIBROSA_HOP_LENGTH)
+        tempo, beat_frames = librosa.beat.beat_track(
+            onset_envelope=onset_env, sr=sr, hop_length=LIBROSA_HOP_LENGTH
+        )
+        beat_times = librosa.frames_to_time(beat_frames, sr=sr, hop_length=LIBROSA_HOP_LENGTH)
 
         # Handle edge case: no beats detected
         if len(beat_times) == 0:
@@ -220,21 +446,13 @@ class BeatDetector:
         # Handle numpy scalar for tempo
         bpm = float(tempo) if hasattr(tempo, "item") else float(tempo)
 
-        beats = []
-        for i, time_sec in enumerate(beat_times):
-            beat_number = (i % 4) + 1
-            beats.append({
-                "time_ms": int(time_sec * 1000),
-                "beat_number": beat_number,
-                "is_downbeat": beat_number == 1,
-            })
+        beats = _build_beats(beat_times)
 
         return BeatGrid(
             version="1.0",
             analyzer="librosa",
-            analyzed_at=datetime.utcnow().isoformat() + "Z",
             audio_file_checksum=checksum,
-            sample_rate=22050,
+            sample_rate=LIBROSA_SAMPLE_RATE,
             duration_ms=duration_ms,
             bpm=bpm,
             bpm_confidence=0.7,
@@ -253,24 +471,11 @@ class BeatDetector:
         default_bpm = 120.0
         beat_interval_ms = int(60000 / default_bpm)  # 500ms at 120 BPM
 
-        beats = []
-        current_ms = 0
-        beat_index = 0
-
-        while current_ms < duration_ms:
-            beat_number = (beat_index % 4) + 1
-            beats.append({
-                "time_ms": current_ms,
-                "beat_number": beat_number,
-                "is_downbeat": beat_number == 1,
-            })
-            current_ms += beat_interval_ms
-            beat_index += 1
+        beats = _beats_from_ms(np.arange(0, duration_ms, beat_interval_ms, dtype=np.int64))
 
         return BeatGrid(
             version="1.0",
             analyzer=f"{analyzer}_default",
-            analyzed_at=datetime.utcnow().isoformat() + "Z",
             audio_file_checksum=checksum,
             sample_rate=44100,
             duration_ms=duration_ms,
@@ -282,13 +487,42 @@ class BeatDetector:
         )
 
     def _save_beat_grid(self, beat_grid: BeatGrid, output_path: str) -> None:
-        """Save beat grid to filesystem (authoritative storage)."""
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(beat_grid.to_dict(), f, indent=2)
+        """
+        Save beat grid to filesystem (authoritative storage).
+
+        The parent directory must already exist (analyze_beats creates it).
+        """
+        with open(output_path, "wb") as f:
+            f.write(_dump_beat_grid(beat_grid))
         logger.info(f"Beat grid saved to {output_path}")
 
 
+_detector: Optional[BeatDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_beat_detector() -> BeatDetector:
+    """
+    Return the process-wide BeatDetector, creating it on first use.
+
+    The worker calls this before forking so every job's work horse
+    inherits the same initialised detector.
+    """
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = BeatDetector()
+    return _detector
+
+
+# Progress throttling for update_job_progress: (job id, percent, monotonic time)
+# of the last save_meta().
+PROGRESS_SAVE_STEP = 20  # percent
+PROGRESS_SAVE_INTERVAL = 5.0  # seconds
+_last_progress_save: tuple = (None, 0, 0.0)
+
+
 def update_job_progress(percent: int, message: str) -> None:
     """
     Update RQ job progress metadata.
@@ -297,14 +531,29 @@ def update_job_progress(percent: int, message: str) -> None:
         percent: Progress percentage (0-100)
         message: Progress message
     """
+    global _last_progress_save
+
     job = get_current_job()
     if job:
         job.meta["progress_percent"] = percent
         job.meta["progress_message"] = message
-        job.save_meta()
 
-
-def enqueue_beat_analysis(project_id: str, audio_id: str):
+        # save_meta() re-serializes the whole meta blob to Redis, so only
+        # save on a large enough step, after a quiet period, or at 100%;
+        # skipped updates ride along with the next save.
+        now = time.monotonic()
+        last_job_id, last_percent, last_time = _last_progress_save
+        if (
+            job.id != last_job_id
+            or percent >= 100
+            or percent - last_percent >= PROGRESS_SAVE_STEP
+            or now - last_time >= PROGRESS_SAVE_INTERVAL
+        ):
+            job.save_meta()
+            _last_progress_save = (job.id, percent, now)
+
+
+def enqueue_beat_analysis(project_id: str, audio_id: str, force: bool = False):
     """
     Enqueue a beat analysis job with proper timeout.
 
@@ -314,6 +563,7 @@ def enqueue_beat_analysis(project_id: str, audio_id: str):
     Args:
         project_id: UUID of the project
         audio_id: UUID of the AudioTrack record
+        force: Re-run detection even if a cached beat grid exists
 
     Returns:
         RQ Job instance
@@ -324,11 +574,12 @@ def enqueue_beat_analysis(project_id: str, audio_id: str):
         analyze_beats,
         project_id,
         audio_id,
+        force=force,
         job_timeout=BEAT_ANALYSIS_TIMEOUT,
     )
 
 
-def analyze_beats(project_id: str, audio_id: str) -> dict:
+def analyze_beats(project_id: str, audio_id: str, force: bool = False) -> dict:
     """
     RQ task to analyze audio for beat detection.
 
@@ -339,6 +590,7 @@ def analyze_beats(project_id: str, audio_id: str) -> dict:
     Args:
         project_id: UUID of the project
         audio_id: UUID of the AudioTrack record
+        force: Skip cached beat grids and re-run detection (manual re-analysis)
 
     Returns:
         dict with beats_path, bpm, and beat_count
@@ -347,37 +599,22 @@ def analyze_beats(project_id: str, audio_id: str) -> dict:
         FileNotFoundError: If audio file doesn't exist
         ValueError: If AudioTrack record not found
     """
-    from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, BigInteger
-    from sqlalchemy.orm import declarative_base
-
-    # Define AudioTrack model locally to avoid circular imports
-    # This matches the schema from backend/app/models/audio.py
-    Base = declarative_base()
-
-    class AudioTrack(Base):
-        __tablename__ = "audio_tracks"
-        id = Column(String(36), primary_key=True)
-        project_id = Column(String(36), nullable=False)  # FK to projects.id
-        filename = Column(String(255), nullable=False)
-        original_filename = Column(String(255), nullable=False)
-        file_path = Column(String(500), nullable=False)
-        file_size = Column(BigInteger, nullable=False)
-        duration_ms = Column(Integer, nullable=False)
-        sample_rate = Column(Integer, nullable=True)
-        bpm = Column(Float, nullable=True)
-        beat_count = Column(Integer, nullable=True)
-        beat_grid_path = Column(String(500), nullable=True)
-        analysis_status = Column(String(20), default="pending", nullable=False)
-        analysis_error = Column(String(500), nullable=True)
-        analyzed_at = Column(DateTime, nullable=True)
-        created_at = Column(DateTime, nullable=False)
-
     logger.info(f"Starting beat analysis for project={project_id}, audio={audio_id}")
     update_job_progress(0, "Starting beat analysis")
 
     with get_db_session() as db:
-        # Get the audio track record
-        audio_record = db.query(AudioTrack).filter_by(id=audio_id).first()
+
+        def set_audio_fields(**values) -> None:
+            # Core UPDATE: no ORM load / dirty tracking / flush for status writes
+            db.execute(update(AudioTrack).where(AudioTrack.id == audio_id).values(**values))
+            db.commit()
+
+        # Get the audio track record (only the columns this task reads)
+        audio_record = (
+            db.query(AudioTrack.project_id, AudioTrack.file_path)
+            .filter_by(id=audio_id)
+            .first()
+        )
 
         if not audio_record:
             raise ValueError(f"AudioTrack not found: {audio_id}")
@@ -387,9 +624,7 @@ def analyze_beats(project_id: str, audio_id: str) -> dict:
             raise ValueError(f"AudioTrack {audio_id} does not belong to project {project_id}")
 
         # Update status to processing
-        audio_record.analysis_status = "processing"
-        audio_record.analysis_error = None
-        db.commit()
+        set_audio_fields(analysis_status="processing", analysis_error=None)
 
         try:
             # Resolve audio path
@@ -407,8 +642,8 @@ def analyze_beats(project_id: str, audio_id: str) -> dict:
             update_job_progress(20, "Detecting beats")
 
             # Run beat detection
-            detector = BeatDetector()
-            beat_grid = detector.analyze(str(audio_path), str(beats_path))
+            detector = get_beat_detector()
+            beat_grid = detector.analyze(str(audio_path), str(beats_path), force=force)
 
             update_job_progress(90, "Saving results")
 
@@ -416,14 +651,15 @@ def analyze_beats(project_id: str, audio_id: str) -> dict:
             # Store relative path (relative to /data)
             relative_beats_path = f"derived/{project_id}/beats.json"
 
-            audio_record.bpm = beat_grid.bpm
-            audio_record.beat_count = beat_grid.total_beats
-            audio_record.beat_grid_path = relative_beats_path
-            audio_record.duration_ms = beat_grid.duration_ms  # Save audio duration
-            audio_record.analysis_status = "complete"
-            audio_record.analysis_error = None
-            audio_record.analyzed_at = datetime.utcnow()
-            db.commit()
+            set_audio_fields(
+                bpm=beat_grid.bpm,
+                beat_count=beat_grid.total_beats,
+                beat_grid_path=relative_beats_path,
+                duration_ms=beat_grid.duration_ms,  # Save audio duration
+                analysis_status="complete",
+                analysis_error=None,
+                analyzed_at=datetime.utcnow(),
+            )
 
             update_job_progress(100, "Analysis complete")
 
@@ -442,9 +678,8 @@ def analyze_beats(project_id: str, audio_id: str) -> dict:
         except Exception as e:
             # Update status to failed
             error_message = str(e)[:500]  # Truncate to fit database column
-            audio_record.analysis_status = "failed"
-            audio_record.analysis_error = error_message
-            db.commit()
+            db.rollback()
+            set_audio_fields(analysis_status="failed", analysis_error=error_message)
 
             logger.error(f"Beat analysis failed: {e}")
             raise
@@ -13,10 +13,11 @@ Usage:
 import hashlib
 import json
 import logging
-from copy import deepcopy
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,74 @@ EFFECT_PRESET_TO_KEN_BURNS = {
     "none": None,
 }
 
+# (start_zoom, end_zoom, pan_direction) per preset, for building each
+# segment's own ken_burns dict without copying the table entry.
+_KEN_BURNS_BY_PRESET = {
+    name: (preset["start_zoom"], preset["end_zoom"], preset["pan_direction"])
+    for name, preset in EFFECT_PRESET_TO_KEN_BURNS.items()
+    if preset
+}
+
+# Effects dict template per Ken Burns preset; segments get a copy.
+_EFFECTS_BY_PRESET = {
+    name: {
+        "motion_preset": name,
+        "motion_strength": 1.0,
+        "beat_sync_mode": "none",
+        "beat_sync_n": 4,
+    }
+    for name in _KEN_BURNS_BY_PRESET
+}
+
+# Nested dict fields of an EDL segment (see _build_segment); each is None or
+# a flat dict of scalars.
+_SEGMENT_DICT_FIELDS = ("ken_burns", "effects", "transition_in", "transition_out")
+
+
+def _clone_segment(seg: dict) -> dict:
+    """
+    Copy an EDL segment built by _build_segment.
+
+    Segments are flat apart from the small dicts in _SEGMENT_DICT_FIELDS, so
+    copying the outer dict and those is a full copy without deepcopy's memo
+    and per-type dispatch.
+    """
+    new = seg.copy()
+    for key in _SEGMENT_DICT_FIELDS:
+        value = new[key]
+        if value is not None:
+            new[key] = value.copy()
+    return new
+
+
+# orjson options for the canonical JSON hashed into edl_hash
+_HASH_JSON_OPTIONS = orjson.OPT_SORT_KEYS
+
+
+def _canonical_json(value: Any) -> bytes:
+    """
+    Canonical JSON bytes of value for edl_hash: sorted keys, compact, and
+    non-ASCII \\u-escaped exactly as json.dumps() writes it.
+
+    orjson emits raw UTF-8, so the rare non-ASCII value is re-serialized with
+    json.dumps() to keep edl_hash unchanged.
+    """
+    data = orjson.dumps(value, option=_HASH_JSON_OPTIONS)
+    if data.isascii():
+        return data
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _segment_hash_fragment(seg: dict) -> bytes:
+    """Canonical JSON of the fields of an EDL segment that feed edl_hash."""
+    return _canonical_json(
+        {
+            "asset_id": seg["media_asset_id"],
+            "duration": seg["render_duration_ms"],
+            "effects": seg.get("effects"),
+        }
+    )
+
 
 class EditRequestToEDLConverter:
     """
@@ -112,6 +181,7 @@ class EditRequestToEDLConverter:
 
         # Get effective BPM
         effective_bpm = self._get_effective_bpm(edit_request)
+        ms_per_beat = (60000 / effective_bpm) if effective_bpm else None
 
         # Build segments
         segments = []
@@ -122,7 +192,7 @@ class EditRequestToEDLConverter:
                 segment=segment,
                 segment_idx=idx,
                 timeline_position=timeline_position,
-                effective_bpm=effective_bpm,
+                ms_per_beat=ms_per_beat,
                 beats_per_cut=beats_per_cut,
                 default_effect=default_effect,
             )
@@ -184,11 +254,32 @@ class EditRequestToEDLConverter:
 
     def _prefetch_assets(self, edit_request: dict, project_id: str) -> None:
         """Prefetch all referenced assets from database."""
-        media_ids = {seg["asset_id"] for seg in edit_request["timeline"]}
-        audio_ids = set()
+        media_ids = {seg["asset_id"] for seg in edit_request["timeline"] if seg.get("asset_id")}
+        # A null audio asset_id must not turn into a query for id IN (NULL)
         audio_settings = edit_request.get("audio")
-        if audio_settings:
-            audio_ids.add(audio_settings.get("asset_id"))
+        audio_id = audio_settings.get("asset_id") if audio_settings else None
+        audio_ids = {audio_id} if audio_id else set()
+
+        # Fetch media and audio in one round trip: the audio track is joined
+        # onto every media row (there is at most one audio id).  An empty
+        # media result also means no audio, but convert() then fails on the
+        # missing media asset regardless.
+        if media_ids and audio_ids:
+            rows = self.db.query(self.MediaAsset, self.AudioTrack).outerjoin(
+                self.AudioTrack,
+                and_(
+                    self.AudioTrack.project_id == project_id,
+                    self.AudioTrack.id.in_(audio_ids),
+                ),
+            ).filter(
+                self.MediaAsset.project_id == project_id,
+                self.MediaAsset.id.in_(media_ids),
+            ).all()
+            for asset, track in rows:
+                self._media_cache[asset.id] = asset
+                if track is not None:
+                    self._audio_cache[track.id] = track
+            return
 
         # Fetch media
         if media_ids:
@@ -228,7 +319,7 @@ class EditRequestToEDLConverter:
         segment: dict,
         segment_idx: int,
         timeline_position: int,
-        effective_bpm: Optional[float],
+        ms_per_beat: Optional[float],
         beats_per_cut: int,
         default_effect: Optional[str],
     ) -> dict:
@@ -238,13 +329,20 @@ class EditRequestToEDLConverter:
         if not asset:
             raise ValueError(f"Asset not found: {asset_id}")
 
+        # Read every segment / asset field once up front
         segment_type = segment["type"]
+        source = segment.get("source")
+        effect_preset = segment.get("effect") or default_effect
+        trans = segment.get("transition_in")
+        asset_duration_ms = asset.duration_ms
 
         # Calculate duration
         duration_ms = self._calculate_duration(
-            segment=segment,
-            asset=asset,
-            effective_bpm=effective_bpm,
+            duration=segment.get("duration"),
+            segment_type=segment_type,
+            source=source,
+            asset_duration_ms=asset_duration_ms,
+            ms_per_beat=ms_per_beat,
             beats_per_cut=beats_per_cut,
         )
 
@@ -252,33 +350,31 @@ class EditRequestToEDLConverter:
         source_in_ms = 0
         source_out_ms = duration_ms
 
-        source = segment.get("source")
         if source and segment_type == "video":
             source_in_ms = source.get("in_ms", 0)
-            if source.get("out_ms"):
-                source_out_ms = source["out_ms"] - source_in_ms
-            elif asset.duration_ms:
-                source_out_ms = min(duration_ms, asset.duration_ms - source_in_ms)
+            source_out = source.get("out_ms")
+            if source_out:
+                source_out_ms = source_out - source_in_ms
+            elif asset_duration_ms:
+                source_out_ms = min(duration_ms, asset_duration_ms - source_in_ms)
 
         # Build effects
         ken_burns = None
         effects = None
 
-        effect_preset = segment.get("effect") or default_effect
         if effect_preset and effect_preset != "none" and segment_type == "image":
-            ken_burns = EFFECT_PRESET_TO_KEN_BURNS.get(effect_preset)
-            if ken_burns:
-                ken_burns = deepcopy(ken_burns)
-                effects = {
-                    "motion_preset": effect_preset,
-                    "motion_strength": 1.0,
-                    "beat_sync_mode": "none",
-                    "beat_sync_n": 4,
+            preset = _KEN_BURNS_BY_PRESET.get(effect_preset)
+            if preset:
+                start_zoom, end_zoom, pan_direction = preset
+                ken_burns = {
+                    "start_zoom": start_zoom,
+                    "end_zoom": end_zoom,
+                    "pan_direction": pan_direction,
                 }
+                effects = _EFFECTS_BY_PRESET[effect_preset].copy()
 
         # Build transition
         transition_in = None
-        trans = segment.get("transition_in")
         if trans:
             transition_in = {
                 "type": trans.get("type", "cut"),
@@ -302,42 +398,47 @@ class EditRequestToEDLConverter:
 
     def _calculate_duration(
         self,
-        segment: dict,
-        asset,
-        effective_bpm: Optional[float],
+        duration: Optional[dict],
+        segment_type: str,
+        source: Optional[dict],
+        asset_duration_ms: Optional[int],
+        ms_per_beat: Optional[float],
         beats_per_cut: int,
     ) -> int:
-        """Calculate segment duration based on mode."""
-        duration = segment.get("duration")
-        segment_type = segment["type"]
+        """
+        Calculate segment duration based on mode.
 
+        Takes the timeline segment's duration / type / source fields and the
+        media asset's duration_ms, as already read by _build_segment.
+        ms_per_beat is 60000 / effective BPM (computed once per convert()),
+        or None when no BPM is known.
+        """
         # Use defaults if no explicit duration
         if duration is None:
-            if effective_bpm:
-                return int(beats_per_cut * (60000 / effective_bpm))
-            elif segment_type == "video" and asset.duration_ms:
-                return asset.duration_ms
+            if ms_per_beat:
+                return int(beats_per_cut * ms_per_beat)
+            elif segment_type == "video" and asset_duration_ms:
+                return asset_duration_ms
             else:
                 return DEFAULT_IMAGE_DURATION_MS
 
         mode = duration.get("mode")
 
         if mode == "beats":
-            if not effective_bpm:
+            if not ms_per_beat:
                 raise ValueError("BPM required for beats-based duration")
-            return int(duration["count"] * (60000 / effective_bpm))
+            return int(duration["count"] * ms_per_beat)
 
         elif mode == "ms":
             return duration["value"]
 
         elif mode == "natural":
             if segment_type == "video":
-                source = segment.get("source")
                 if source and source.get("out_ms"):
                     in_ms = source.get("in_ms", 0)
                     return source["out_ms"] - in_ms
-                elif asset.duration_ms:
-                    return asset.duration_ms
+                elif asset_duration_ms:
+                    return asset_duration_ms
             return DEFAULT_IMAGE_DURATION_MS
 
         return DEFAULT_IMAGE_DURATION_MS
@@ -352,25 +453,27 @@ class EditRequestToEDLConverter:
         if len(segments) <= 1:
             return segments
 
-        segments = deepcopy(segments)
+        segments = [_clone_segment(seg) for seg in segments]
         overlap_ms = transition_duration_ms
 
         for i in range(len(segments)):
             effective_overlap = min(overlap_ms, segments[i]["render_duration_ms"] // 2)
-            effective_transition = {
-                "type": transition_type,
-                "duration_ms": effective_overlap,
-            }
 
             if i == 0:
                 segments[i]["transition_in"] = None
             else:
                 if not segments[i].get("transition_in"):
-                    segments[i]["transition_in"] = deepcopy(effective_transition)
+                    segments[i]["transition_in"] = {
+                        "type": transition_type,
+                        "duration_ms": effective_overlap,
+                    }
                 segments[i]["timeline_in_ms"] -= effective_overlap
 
             if i < len(segments) - 1:
-                segments[i]["transition_out"] = deepcopy(effective_transition)
+                segments[i]["transition_out"] = {
+                    "type": transition_type,
+                    "duration_ms": effective_overlap,
+                }
 
             segments[i]["render_duration_ms"] = (
                 segments[i]["timeline_out_ms"] - segments[i]["timeline_in_ms"]
@@ -392,7 +495,7 @@ class EditRequestToEDLConverter:
         if total_duration >= audio_duration_ms:
             return self._trim_to_duration(segments, audio_duration_ms)
 
-        expanded = deepcopy(segments)
+        expanded = [_clone_segment(seg) for seg in segments]
         current_position = total_duration
         next_segment_idx = len(segments)
 
@@ -406,7 +509,7 @@ class EditRequestToEDLConverter:
                     remaining = audio_duration_ms - current_position
                     actual_duration = min(duration, remaining)
 
-                    new_seg = deepcopy(seg)
+                    new_seg = _clone_segment(seg)
                     new_seg["segment_index"] = next_segment_idx
                     new_seg["timeline_in_ms"] = current_position
                     new_seg["timeline_out_ms"] = current_position + actual_duration
@@ -420,7 +523,7 @@ class EditRequestToEDLConverter:
                 last_seg = segments[-1]
                 remaining = audio_duration_ms - current_position
 
-                new_seg = deepcopy(last_seg)
+                new_seg = _clone_segment(last_seg)
                 new_seg["segment_index"] = next_segment_idx
                 new_seg["timeline_in_ms"] = current_position
                 new_seg["timeline_out_ms"] = audio_duration_ms
@@ -443,7 +546,7 @@ class EditRequestToEDLConverter:
             if seg["timeline_in_ms"] >= target_duration_ms:
                 break
 
-            new_seg = deepcopy(seg)
+            new_seg = _clone_segment(seg)
             if seg["timeline_out_ms"] > target_duration_ms:
                 new_seg["timeline_out_ms"] = target_duration_ms
                 new_seg["render_duration_ms"] = target_duration_ms - seg["timeline_in_ms"]
@@ -453,23 +556,29 @@ class EditRequestToEDLConverter:
         return result
 
     def _compute_hash(self, segments: List[dict], edit_request: dict) -> str:
-        """Compute SHA-256 hash of EDL content."""
+        """
+        Compute SHA-256 hash of EDL content.
+
+        The digest is of the canonical JSON (see _canonical_json) of
+        {"audio_asset_id", "repeat_mode", "segments", "transition_type"}.
+        It is fed to the hasher piece by piece, in sorted-key order, so the
+        full payload string and per-segment dict list are never built.
+        """
         audio_settings = edit_request.get("audio")
         defaults = edit_request.get("defaults", {})
         repeat_settings = edit_request.get("repeat", {})
 
-        payload = {
-            "segments": [
-                {
-                    "asset_id": s["media_asset_id"],
-                    "duration": s["render_duration_ms"],
-                    "effects": s.get("effects"),
-                }
-                for s in segments
-            ],
-            "audio_asset_id": audio_settings.get("asset_id") if audio_settings else None,
-            "transition_type": defaults.get("transition", {}).get("type", "cut"),
-            "repeat_mode": repeat_settings.get("mode", "repeat_all"),
-        }
-        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        hasher = hashlib.sha256()
+        hasher.update(b'{"audio_asset_id":')
+        hasher.update(_canonical_json(audio_settings.get("asset_id") if audio_settings else None))
+        hasher.update(b',"repeat_mode":')
+        hasher.update(_canonical_json(repeat_settings.get("mode", "repeat_all")))
+        hasher.update(b',"segments":[')
+        for i, seg in enumerate(segments):
+            if i:
+                hasher.update(b",")
+            hasher.update(_segment_hash_fragment(seg))
+        hasher.update(b'],"transition_type":')
+        hasher.update(_canonical_json(defaults.get("transition", {}).get("type", "cut")))
+        hasher.update(b"}")
+        return hasher.hexdigest()
@@ -12,15 +12,19 @@ This is the primary protection against runaway FFmpeg processes.
 
 import logging
 import os
-import re
 import select
 import signal
 import subprocess
+import tempfile
 import time
-from typing import Callable, List, Optional
+from typing import IO, Callable, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Longest the progress loop waits for output before re-checking the timeout
+# and stall conditions.
+PROGRESS_POLL_INTERVAL_SECONDS = 1.0
+
 
 class FFmpegTimeout(Exception):
     """Raised when FFmpeg exceeds the allowed timeout."""
@@ -76,31 +80,31 @@ def run_ffmpeg_with_progress(
     logger.info(f"Starting FFmpeg with timeout={timeout_seconds}s, duration={total_duration_ms}ms")
     logger.debug(f"FFmpeg command: {' '.join(cmd_with_progress)}")
 
+    # stderr goes to an unlinked temp file rather than a pipe: nothing
+    # drains stderr while progress is read, so a pipe would fill (~64KB of
+    # verbose filter output) and block FFmpeg.  Only its tail is ever read.
+    stderr_file = tempfile.TemporaryFile()
+
     # Start process in its own process group for clean termination
-    # preexec_fn=os.setsid creates a new session/process group
+    # start_new_session=True calls setsid() in the child without a Python
+    # preexec_fn, which keeps subprocess on its fast spawn path
     process = subprocess.Popen(
         cmd_with_progress,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-        preexec_fn=os.setsid,
+        stderr=stderr_file,
+        start_new_session=True,
     )
 
-    # Patterns for parsing progress output
-    # Prefer out_time_us (microseconds) as it's most reliable
-    time_us_pattern = re.compile(r"out_time_us=(\d+)")
-    time_ms_pattern = re.compile(r"out_time_ms=(\d+)")
-    time_str_pattern = re.compile(r"out_time=(\d+):(\d+):(\d+)\.(\d+)")
-    progress_pattern = re.compile(r"progress=(\w+)")
-
     start_time = time.time()
     last_percent = 0
     last_progress_time = start_time
     stall_warned = False  # Debounce flag for stall warning
 
     try:
-        # Read progress from stdout line by line
-        for line in process.stdout:
+        # Read progress from stdout line by line.  An empty line is yielded
+        # whenever FFmpeg is silent for a poll interval, so the timeout and
+        # stall checks below run even when no progress arrives.
+        for line in _iter_output_lines(process.stdout, PROGRESS_POLL_INTERVAL_SECONDS):
             line = line.strip()
 
             # Check timeout
@@ -110,17 +114,17 @@ def run_ffmpeg_with_progress(
                 _kill_process_group(process)
                 raise FFmpegTimeout(f"FFmpeg exceeded timeout of {timeout_seconds} seconds")
 
+            # -progress output is strict key=value lines
+            key, _, value = line.partition("=")
+
             # Check for completion
-            progress_match = progress_pattern.search(line)
-            if progress_match and progress_match.group(1) == "end":
+            if key == "progress" and value == "end":
                 progress_callback(100, "Render complete")
                 logger.info("FFmpeg signaled completion")
                 break
 
             # Try to extract current time (in order of preference)
-            current_ms = _parse_progress_time(
-                line, time_us_pattern, time_ms_pattern, time_str_pattern
-            )
+            current_ms = _parse_progress_time(key, value)
 
             # Calculate and report progress
             if current_ms is not None and total_duration_ms > 0:
@@ -136,11 +140,9 @@ def run_ffmpeg_with_progress(
                     logger.warning("FFmpeg appears stalled (no progress for 60s)")
                     # Try to capture any stderr output for debugging
                     try:
-                        readable, _, _ = select.select([process.stderr], [], [], 0)
-                        if readable:
-                            stderr_data = process.stderr.read(4096)
-                            if stderr_data:
-                                logger.warning(f"FFmpeg stderr during stall: {stderr_data[:1000]}")
+                        stderr_text = _read_tail(stderr_file, 1000)
+                        if stderr_text:
+                            logger.warning(f"FFmpeg stderr during stall: {stderr_text}")
                     except Exception as e:
                         logger.debug(f"Could not read stderr: {e}")
                     stall_warned = True
@@ -158,11 +160,10 @@ def run_ffmpeg_with_progress(
 
         # Check return code
         if return_code != 0:
-            stderr_output = process.stderr.read()
+            # Truncate stderr to reasonable length
+            stderr_truncated = _read_tail(stderr_file, 2000)
             error_msg = f"FFmpeg failed with code {return_code}"
-            if stderr_output:
-                # Truncate stderr to reasonable length
-                stderr_truncated = stderr_output[-2000:] if len(stderr_output) > 2000 else stderr_output
+            if stderr_truncated:
                 error_msg += f": {stderr_truncated}"
             logger.error(error_msg)
             raise FFmpegError(error_msg)
@@ -182,60 +183,93 @@ def run_ffmpeg_with_progress(
         _kill_process_group(process)
         raise FFmpegError(f"FFmpeg error: {str(e)}")
 
+    finally:
+        stderr_file.close()
+
 
-def _parse_progress_time(
-    line: str,
-    time_us_pattern: re.Pattern,
-    time_ms_pattern: re.Pattern,
-    time_str_pattern: re.Pattern,
-) -> Optional[int]:
+def _iter_output_lines(stream: IO[bytes], poll_interval: float) -> Iterator[str]:
     """
-    Parse current output time from FFmpeg progress line.
+    Yield decoded lines from a subprocess pipe until EOF.
 
-    Tries multiple formats in order of preference:
+    Waits at most poll_interval seconds for output at a time; when nothing
+    arrives in that window an empty string is yielded so the caller can run
+    periodic checks.
+
+    Args:
+        stream: Binary pipe (e.g. process.stdout)
+        poll_interval: Maximum seconds to wait for output per iteration
+    """
+    fd = stream.fileno()
+    pending = b""
+    while True:
+        readable, _, _ = select.select([fd], [], [], poll_interval)
+        if not readable:
+            yield ""
+            continue
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            if pending:
+                yield pending.decode(errors="replace")
+            return
+        *lines, pending = (pending + chunk).split(b"\n")
+        for raw in lines:
+            yield raw.decode(errors="replace")
+
+
+def _read_tail(f: IO[bytes], max_bytes: int) -> str:
+    """
+    Return the last max_bytes of a file FFmpeg is writing to, decoded.
+
+    Uses pread so the shared file offset FFmpeg writes at is not moved.
+    """
+    fd = f.fileno()
+    size = os.fstat(fd).st_size
+    offset = max(0, size - max_bytes)
+    return os.pread(fd, size - offset, offset).decode(errors="replace")
+
+
+def _parse_progress_time(key: str, value: str) -> Optional[int]:
+    """
+    Parse current output time from one FFmpeg progress key=value pair.
+
+    Recognizes, in order of preference (FFmpeg writes one key per line):
     1. out_time_us (microseconds) - most accurate
     2. out_time_ms (milliseconds)
     3. out_time (HH:MM:SS.microseconds string)
 
+    Values FFmpeg reports before the first frame ("N/A", negative
+    times) are ignored.
+
     Args:
-        line: Line of FFmpeg progress output
-        time_us_pattern: Compiled regex for out_time_us
-        time_ms_pattern: Compiled regex for out_time_ms
-        time_str_pattern: Compiled regex for out_time string
+        key: Progress key (text before "=")
+        value: Progress value (text after "=")
 
     Returns:
-        Current time in milliseconds, or None if not found
+        Current time in milliseconds, or None if not a (valid) time
     """
-    current_ms: Optional[int] = None
-
     # Method 1: out_time_us (microseconds -> milliseconds)
-    match = time_us_pattern.search(line)
-    if match:
-        current_ms = int(match.group(1)) // 1000
-        return current_ms
+    if key == "out_time_us":
+        return int(value) // 1000 if value.isdigit() else None
 
     # Method 2: out_time_ms (already milliseconds)
-    match = time_ms_pattern.search(line)
-    if match:
-        current_ms = int(match.group(1))
-        return current_ms
-
-    # Method 3: Parse out_time string HH:MM:SS.microseconds
-    match = time_str_pattern.search(line)
-    if match:
-        hours = int(match.group(1))
-        minutes = int(match.group(2))
-        seconds = int(match.group(3))
-        # Group 4 is microseconds (6 digits, but may be truncated)
-        micro_str = match.group(4).ljust(6, "0")[:6]
-        microseconds = int(micro_str)
-        current_ms = (
+    if key == "out_time_ms":
+        return int(value) if value.isdigit() else None
+
+    # Method 3: out_time string HH:MM:SS.microseconds
+    if key == "out_time":
+        hms, _, frac = value.partition(".")
+        parts = hms.split(":")
+        if len(parts) != 3 or not frac.isdigit() or not all(p.isdigit() for p in parts):
+            return None
+        hours, minutes, seconds = map(int, parts)
+        # Fraction is microseconds (6 digits, but may be truncated)
+        microseconds = int(frac.ljust(6, "0")[:6])
+        return (
             hours * 3600000
             + minutes * 60000
             + seconds * 1000
             + microseconds // 1000
         )
-        return current_ms
 
     return None
 
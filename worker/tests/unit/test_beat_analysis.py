@@ -0,0 +1,157 @@
+"""
+Unit tests for BeatDetector beat grid caching.
+"""
+
+import pytest
+
+from app.tasks import beat_analysis
+from app.tasks.beat_analysis import BeatDetector, BeatGrid, MADMOM_SETTINGS
+
+CHECKSUM = "sha256:abc"
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the get/setex calls the detector makes."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+def make_grid(analyzer="madmom", settings=MADMOM_SETTINGS, bpm=128.0):
+    return BeatGrid(
+        bpm=bpm,
+        total_beats=1,
+        time_signature="4/4",
+        beats=[{"time_ms": 0, "beat_number": 1, "is_downbeat": True}],
+        analyzer=analyzer,
+        analyzer_settings=settings,
+        audio_file_checksum=CHECKSUM,
+    )
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(beat_analysis, "get_redis_connection", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    det = BeatDetector()
+    det.madmom_available = True
+    monkeypatch.setattr(det, "_compute_checksum", lambda path: CHECKSUM)
+    monkeypatch.setattr(det, "_load_signal", forbid)
+    return det
+
+
+@pytest.fixture
+def paths(tmp_path):
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"audio")
+    return str(audio), str(tmp_path / "beats.json")
+
+
+def forbid(*args, **kwargs):
+    raise AssertionError("analysis should not run")
+
+
+class TestBeatGridCache:
+    """Tests for reuse and caching of analyzed beat grids."""
+
+    def test_miss_runs_madmom_and_caches(self, detector, redis, paths, monkeypatch):
+        calls = []
+
+        def fake_madmom(audio_path, checksum):
+            calls.append(audio_path)
+            return make_grid()
+
+        monkeypatch.setattr(detector, "_analyze_with_madmom", fake_madmom)
+
+        grid = detector.analyze(*paths)
+
+        assert grid.analyzer == "madmom"
+        assert len(calls) == 1
+        assert list(redis.store) == [beat_analysis._beat_grid_cache_key(CHECKSUM)]
+
+    def test_hit_skips_analysis(self, detector, redis, paths, monkeypatch):
+        key = beat_analysis._beat_grid_cache_key(CHECKSUM)
+        redis.store[key] = beat_analysis._dump_beat_grid(make_grid(bpm=140.0))
+        monkeypatch.setattr(detector, "_analyze_with_madmom", forbid)
+        monkeypatch.setattr(detector, "_analyze_with_librosa", forbid)
+
+        grid = detector.analyze(*paths)
+
+        assert grid.bpm == 140.0
+
+    def test_existing_beats_json_reused(self, detector, redis, paths, monkeypatch):
+        audio_path, output_path = paths
+        detector._save_beat_grid(make_grid(bpm=100.0), output_path)
+        monkeypatch.setattr(detector, "_analyze_with_madmom", forbid)
+
+        assert detector.analyze(audio_path, output_path).bpm == 100.0
+
+    def test_librosa_fallback_not_cached(self, detector, redis, paths, monkeypatch):
+        def failing_madmom(audio_path, checksum):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(detector, "_analyze_with_madmom", failing_madmom)
+        monkeypatch.setattr(
+            detector,
+            "_analyze_with_librosa",
+            lambda audio_path, checksum: make_grid(analyzer="librosa", settings=""),
+        )
+
+        grid = detector.analyze(*paths)
+
+        assert grid.analyzer == "librosa"
+        assert redis.store == {}
+
+    def test_fallback_beats_json_not_reused(self, detector, redis, paths, monkeypatch):
+        audio_path, output_path = paths
+        detector._save_beat_grid(make_grid(analyzer="librosa", settings=""), output_path)
+        monkeypatch.setattr(
+            detector, "_analyze_with_madmom", lambda a, c: make_grid()
+        )
+
+        assert detector.analyze(audio_path, output_path).analyzer == "madmom"
+
+    def test_default_grid_not_cached(self, detector, redis, paths, monkeypatch):
+        monkeypatch.setattr(
+            detector,
+            "_analyze_with_madmom",
+            lambda a, c: make_grid(analyzer="madmom_default", settings=""),
+        )
+
+        detector.analyze(*paths)
+
+        assert redis.store == {}
+
+    def test_other_settings_miss(self, detector, redis, paths, monkeypatch):
+        audio_path, output_path = paths
+        detector._save_beat_grid(make_grid(settings="models=1,dbn=online"), output_path)
+        monkeypatch.setattr(
+            detector, "_analyze_with_madmom", lambda a, c: make_grid(bpm=90.0)
+        )
+
+        assert detector.analyze(audio_path, output_path).bpm == 90.0
+
+    def test_force_skips_caches(self, detector, redis, paths, monkeypatch):
+        audio_path, output_path = paths
+        detector._save_beat_grid(make_grid(bpm=100.0), output_path)
+        key = beat_analysis._beat_grid_cache_key(CHECKSUM)
+        redis.store[key] = beat_analysis._dump_beat_grid(make_grid(bpm=100.0))
+        monkeypatch.setattr(
+            detector, "_analyze_with_madmom", lambda a, c: make_grid(bpm=90.0)
+        )
+
+        grid = detector.analyze(audio_path, output_path, force=True)
+
+        assert grid.bpm == 90.0
+        assert b"90.0" in redis.store[key]
@@ -0,0 +1,42 @@
+"""
+Unit tests for app.db session handling.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import app.db
+from app.db import get_db_session
+
+
+@pytest.fixture
+def sqlite_engine(monkeypatch):
+    engine = create_engine("sqlite://")
+    monkeypatch.setattr(app.db, "_engine", engine)
+    monkeypatch.setattr(app.db, "_SessionLocal", None)
+    yield engine
+    app.db._SessionLocal = None
+    engine.dispose()
+
+
+class TestGetDbSession:
+    """Tests for the get_db_session context manager."""
+
+    def test_session_removed_on_exit(self, sqlite_engine):
+        with get_db_session() as db:
+            assert db.execute(text("SELECT 1")).scalar() == 1
+            assert app.db.get_session_factory().registry.has()
+        assert not app.db.get_session_factory().registry.has()
+
+    def test_nesting_raises(self, sqlite_engine):
+        with get_db_session():
+            with pytest.raises(RuntimeError, match="already active"):
+                with get_db_session():
+                    pass
+        assert not app.db.get_session_factory().registry.has()
+
+    def test_sequential_sessions_are_fresh(self, sqlite_engine):
+        with get_db_session() as first:
+            pass
+        with get_db_session() as second:
+            assert second is not first
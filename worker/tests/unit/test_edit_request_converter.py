@@ -0,0 +1,76 @@
+"""
+Unit tests for EditRequestToEDLConverter EDL hashing.
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from app.tasks.edit_request_converter import EditRequestToEDLConverter
+
+
+def reference_hash(segments, edit_request):
+    """edl_hash as originally computed: json.dumps of the whole payload."""
+    audio = edit_request.get("audio")
+    payload = {
+        "segments": [
+            {
+                "asset_id": s["media_asset_id"],
+                "duration": s["render_duration_ms"],
+                "effects": s.get("effects"),
+            }
+            for s in segments
+        ],
+        "audio_asset_id": audio.get("asset_id") if audio else None,
+        "transition_type": edit_request.get("defaults", {})
+        .get("transition", {})
+        .get("type", "cut"),
+        "repeat_mode": edit_request.get("repeat", {}).get("mode", "repeat_all"),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def make_segment(asset_id, duration, effects=None):
+    return {
+        "media_asset_id": asset_id,
+        "render_duration_ms": duration,
+        "effects": effects,
+    }
+
+
+@pytest.fixture
+def converter():
+    return EditRequestToEDLConverter(None, None, None)
+
+
+class TestComputeHash:
+    """edl_hash must stay byte-compatible with the json.dumps payload."""
+
+    @pytest.mark.parametrize(
+        "segments, edit_request",
+        [
+            ([], {}),
+            (
+                [
+                    make_segment("m1", 4000, {"ken_burns": {"start_scale": 1.0, "end_scale": 1.2}}),
+                    make_segment("m2", 2500),
+                ],
+                {
+                    "audio": {"asset_id": "a1"},
+                    "defaults": {"transition": {"type": "crossfade"}},
+                    "repeat": {"mode": "repeat_last"},
+                },
+            ),
+            (
+                [make_segment("média-ü", 1000, {"caption": "日本語 — café"})],
+                {"audio": {"asset_id": "ñ"}},
+            ),
+        ],
+        ids=["empty", "ascii", "non-ascii"],
+    )
+    def test_matches_reference(self, converter, segments, edit_request):
+        assert converter._compute_hash(segments, edit_request) == reference_hash(
+            segments, edit_request
+        )
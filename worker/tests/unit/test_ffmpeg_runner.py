@@ -0,0 +1,132 @@
+"""
+Unit tests for the ffmpeg_runner progress loop.
+
+A small Python child process stands in for FFmpeg; the "-progress pipe:1"
+arguments run_ffmpeg_with_progress appends just land in its sys.argv.
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+from app.tasks import ffmpeg_runner
+from app.tasks.ffmpeg_runner import (
+    FFmpegError,
+    FFmpegTimeout,
+    _iter_output_lines,
+    _read_tail,
+    run_ffmpeg_with_progress,
+)
+
+
+def child(script: str) -> list:
+    """Command running script in a Python child process."""
+    return [sys.executable, "-c", script]
+
+
+@pytest.fixture
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(ffmpeg_runner, "PROGRESS_POLL_INTERVAL_SECONDS", 0.05)
+
+
+class TestIterOutputLines:
+    """Tests for the select-based stdout reader."""
+
+    def test_silence_yields_heartbeats(self):
+        proc = subprocess.Popen(
+            child(
+                "import sys, time; time.sleep(0.5); "
+                "sys.stdout.write('a=1\\nb=2'); sys.stdout.flush()"
+            ),
+            stdout=subprocess.PIPE,
+        )
+        try:
+            lines = list(_iter_output_lines(proc.stdout, 0.05))
+        finally:
+            proc.wait()
+
+        assert lines[0] == ""
+        # The unterminated last line is still delivered at EOF
+        assert [line for line in lines if line] == ["a=1", "b=2"]
+
+    def test_lines_split_across_reads(self):
+        proc = subprocess.Popen(
+            child(
+                "import sys, time; sys.stdout.write('out_ti'); sys.stdout.flush(); "
+                "time.sleep(0.2); sys.stdout.write('me_us=5\\n'); sys.stdout.flush()"
+            ),
+            stdout=subprocess.PIPE,
+        )
+        try:
+            lines = [line for line in _iter_output_lines(proc.stdout, 0.05) if line]
+        finally:
+            proc.wait()
+
+        assert lines == ["out_time_us=5"]
+
+
+class TestReadTail:
+    """Tests for reading the stderr temp file's tail."""
+
+    def test_returns_last_bytes_without_moving_offset(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"0123456789")
+            f.flush()
+            assert _read_tail(f, 4) == "6789"
+            assert _read_tail(f, 100) == "0123456789"
+            assert f.tell() == 10
+
+
+class TestRunFFmpegWithProgress:
+    """Tests for timeout, failure and progress handling."""
+
+    def test_silent_child_times_out(self, fast_poll):
+        start = time.time()
+        with pytest.raises(FFmpegTimeout):
+            run_ffmpeg_with_progress(
+                child("import time; time.sleep(30)"),
+                total_duration_ms=1000,
+                progress_callback=lambda p, m: None,
+                timeout_seconds=0,
+            )
+        # Heartbeats let the timeout fire without any output from the child
+        assert time.time() - start < 10
+
+    def test_failure_message_has_stderr_tail(self, fast_poll):
+        script = (
+            "import sys\n"
+            "for i in range(5000):\n"
+            "    sys.stderr.write(f'stderr line {i}\\n')\n"
+            "sys.exit(3)\n"
+        )
+        with pytest.raises(FFmpegError) as exc_info:
+            run_ffmpeg_with_progress(
+                child(script),
+                total_duration_ms=1000,
+                progress_callback=lambda p, m: None,
+                timeout_seconds=30,
+            )
+
+        message = str(exc_info.value)
+        assert message.startswith("FFmpeg failed with code 3")
+        assert "stderr line 4999" in message
+        assert "stderr line 0\n" not in message
+
+    def test_reports_progress_and_completion(self, fast_poll):
+        script = (
+            "import sys\n"
+            "sys.stdout.write('out_time_us=N/A\\nout_time_us=500000\\nprogress=end\\n')\n"
+        )
+        calls = []
+        run_ffmpeg_with_progress(
+            child(script),
+            total_duration_ms=1000,
+            progress_callback=lambda p, m: calls.append(p),
+            timeout_seconds=30,
+        )
+
+        assert calls[0] == 50
+        assert calls[-1] == 100